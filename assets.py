@@ -0,0 +1,110 @@
+# assets.py
+# Locally served copies of the third-party JS used by the HTML views, and static
+# data files (e.g. the property-card model) shipped in ./static.
+#
+# Files in ./static are served by Streamlit at app/static/<name>. URLs carry a
+# ?v=<content hash> query, which makes Tornado send a ten-year Cache-Control
+# max-age, so every iframe after the first loads them from the browser cache.
+# Streamlit serves non-image static files as text/plain with nosniff, which a
+# <script src> refuses to execute, so local scripts are fetched and injected.
+#
+# The vendored libraries are pinned to one release each and belong in ./static
+# with their licences: scripts/fetch_assets.py downloads them, and the files
+# are meant to be committed so deployments never reach a CDN. They are not in
+# the tree until someone with network access runs it. A missing copy is
+# reported at startup (check_assets) and in place of every view that needs it;
+# the upstream CDN is used only when PFAS_STUDIO_ASSETS=cdn explicitly allows
+# it, with a warning.
+
+import functools
+import hashlib
+import json
+import logging
+import os
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+# "cdn" lets the app load vendored libraries that have no local copy from
+# their upstream URLs instead of refusing to start.
+ALLOW_CDN = os.environ.get("PFAS_STUDIO_ASSETS", "") == "cdn"
+
+logger = logging.getLogger("pfas_studio.assets")
+
+# Vendored file name -> pinned upstream URL it is fetched from.
+VENDORED = {
+    "3Dmol-min.js": "https://unpkg.com/3dmol@2.0.4/build/3Dmol-min.js",
+    "smiles-drawer.min.js": "https://unpkg.com/smiles-drawer@2.0.1/dist/smiles-drawer.min.js",
+}
+
+# Licence file shipped beside each vendored library -> URL it is fetched from.
+LICENSES = {
+    "3Dmol.LICENSE": "https://unpkg.com/3dmol@2.0.4/LICENSE",
+    "smiles-drawer.LICENSE": "https://unpkg.com/smiles-drawer@2.0.1/LICENSE",
+}
+
+
+class MissingAssetError(RuntimeError):
+    pass
+
+
+@functools.lru_cache(maxsize=None)
+def _digest(name):
+    path = os.path.join(STATIC_DIR, name)
+    if not os.path.isfile(path):
+        return None
+    with open(path, "rb") as fh:
+        return hashlib.sha256(fh.read()).hexdigest()[:12]
+
+
+def missing_assets():
+    # Vendored libraries and licences without a copy in ./static.
+    return [name for name in [*VENDORED, *LICENSES] if not os.path.isfile(os.path.join(STATIC_DIR, name))]
+
+
+def check_assets():
+    # Called once at startup: returns a message naming the missing files (None
+    # if there are none), logged as an error, or only as a warning when the
+    # CDN fallback is allowed.
+    missing = missing_assets()
+    if not missing:
+        return None
+    message = (f"vendored assets missing from {STATIC_DIR}: {', '.join(missing)}; "
+               "run `python scripts/fetch_assets.py` and commit the files")
+    if ALLOW_CDN:
+        logger.warning("%s. PFAS_STUDIO_ASSETS=cdn: loading them from the upstream CDN.", message)
+    else:
+        logger.error("%s. Views that need them are disabled.", message)
+    return message
+
+
+def asset_url(name):
+    # URL relative to the app root. A vendored library without a local copy
+    # resolves to its upstream URL only when the CDN fallback is allowed.
+    digest = _digest(name)
+    if digest is None:
+        if name in VENDORED and ALLOW_CDN:
+            return VENDORED[name]
+        raise MissingAssetError(f"{name} is missing from {STATIC_DIR}")
+    return f"app/static/{name}?v={digest}"
+
+
+def script_tag(name):
+    # HTML that loads a vendored script once per document, usable anywhere in a
+    # st.components.v1.html block. Loading is synchronous so the inline scripts
+    # that follow can use the library straight away.
+    url = asset_url(name)
+    if url == VENDORED.get(name):
+        return f'<script type="text/javascript" src="{url}"></script>'
+    return f"""<script>
+        (function (name, url) {{
+            window.__assets = window.__assets || {{}};
+            if (window.__assets[name]) return;
+            var request = new XMLHttpRequest();
+            request.open("GET", url, false);
+            request.send();
+            var script = document.createElement("script");
+            script.text = request.responseText;
+            document.head.appendChild(script);
+            window.__assets[name] = true;
+        }})({json.dumps(name)}, {json.dumps(url)});
+        </script>"""
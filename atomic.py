@@ -0,0 +1,165 @@
+# atomic.py
+# Per-molecule summaries of per-atom properties (Fukui indices, partial charges),
+# laid out as columns that sit next to the scalar properties.
+
+import numpy as np
+import pandas as pd
+from rdkit import Chem
+
+# Tensor property key -> column label.
+ATOM_PROPERTIES = {
+    "[fp]": "f(+)",
+    "[fm]": "f(-)",
+    "[f0]": "f(0)",
+    "Partial Charge [e]": "Partial Charge",
+}
+
+# Elements that also get their own per-element maximum/minimum columns.
+AGGREGATE_ELEMENTS = ("C", "F", "O")
+
+_PERIODIC_TABLE = Chem.GetPeriodicTable()
+
+
+def atom_elements(tensor_props):
+    # Element symbol of each atom from "[atoms]", which may hold symbols
+    # (optionally numbered, e.g. "C1") or atomic numbers. None if unavailable.
+    atoms = tensor_props.get("[atoms]")
+    if not atoms:
+        return None
+    if isinstance(atoms[0], str):
+        return np.array([a.rstrip("0123456789").capitalize() for a in atoms])
+    return np.array([_PERIODIC_TABLE.GetElementSymbol(int(a)) for a in atoms])
+
+
+def aggregate_columns():
+    columns = []
+    for label in ATOM_PROPERTIES.values():
+        columns += [f"Max {label}", f"Min {label}", f"Argmax {label}"]
+        for element in AGGREGATE_ELEMENTS:
+            columns += [f"Max {label} on {element}", f"Min {label} on {element}"]
+    return columns
+
+
+def _reduce_segments(ufunc, values, ragged):
+    # ufunc.reduceat over each molecule's segment of `values`; NaN where the
+    # segment is empty. Empty segments are skipped, so every remaining start
+    # reduces exactly up to the next molecule's values.
+    out = np.full(len(ragged), np.nan)
+    nonempty = ragged.lengths > 0
+    if nonempty.any():
+        out[nonempty] = ufunc.reduceat(values, ragged.starts[nonempty])
+    return out
+
+
+def _gather(source, target, fill):
+    # Entries of ragged `source` laid out like the entries of ragged `target`,
+    # `fill` for molecules where the two do not have the same length.
+    lengths = target.lengths
+    local = np.arange(lengths.sum()) - np.repeat(target.starts, lengths)
+    aligned = np.repeat(source.lengths == lengths, lengths)
+    index = np.repeat(source.starts, lengths) + local
+    out = np.full(local.size, fill, dtype=source.values.dtype)
+    out[aligned] = source.values[index[aligned]]
+    return out
+
+
+def atom_aggregates(store):
+    # One row per molecule with the max/min of each atomic property, the
+    # 1-based atom number of the maximum, and max/min restricted to each
+    # element of AGGREGATE_ELEMENTS, computed with segment reductions over the
+    # ragged store (see ragged.py). Missing data is NaN.
+    elements = store["[atoms]"]
+    columns = {}
+    for key, label in ATOM_PROPERTIES.items():
+        ragged = store[key]
+        values = np.asarray(ragged.values, dtype=np.float64)
+        lengths = ragged.lengths
+        maxima = _reduce_segments(np.maximum, values, ragged)
+        columns[f"Max {label}"] = maxima
+        columns[f"Min {label}"] = _reduce_segments(np.minimum, values, ragged)
+        # First atom attaining the maximum, as its index within the molecule.
+        local = np.arange(values.size) - np.repeat(ragged.starts, lengths)
+        at_max = values == np.repeat(maxima, lengths)
+        columns[f"Argmax {label}"] = _reduce_segments(np.fmin, np.where(at_max, local, np.nan), ragged) + 1
+        symbols = _gather(elements, ragged, "")
+        for element in AGGREGATE_ELEMENTS:
+            selected = np.where(symbols == element, values, np.nan)
+            columns[f"Max {label} on {element}"] = _reduce_segments(np.fmax, selected, ragged)
+            columns[f"Min {label} on {element}"] = _reduce_segments(np.fmin, selected, ragged)
+    return pd.DataFrame(columns, columns=aggregate_columns(), dtype=np.float64)
+
+
+# Acid headgroups; their atoms are classed "headgroup" whatever else they bond to.
+HEADGROUP_SMARTS = (
+    "[CX3](=O)[OX1-,OX2H1]",
+    "[SX4](=O)(=O)[OX1-,OX2H1]",
+    "[PX4](=O)([OX1-,OX2H1])[OX1-,OX2H1]",
+)
+_HEADGROUPS = [Chem.MolFromSmarts(smarts) for smarts in HEADGROUP_SMARTS]
+_FLUORINATED = ("CF", "CF2", "CF3", "CF4")
+
+
+def environment_classes(smiles, elements):
+    # Environment class of each atom, e.g. "C (CF3)", "F (CF2)", "O (headgroup)"
+    # or "H (other)". The SMILES with explicit hydrogens has to list the same
+    # elements in the same order as `elements`; None otherwise.
+    mol = Chem.MolFromSmiles(smiles) if smiles else None
+    if mol is None:
+        return None
+    mol = Chem.AddHs(mol)
+    symbols = [atom.GetSymbol() for atom in mol.GetAtoms()]
+    if elements is None or list(elements) != symbols:
+        return None
+    environment = ["other"] * len(symbols)
+    for atom in mol.GetAtoms():
+        if atom.GetSymbol() != "C":
+            continue
+        fluorines = [nb.GetIdx() for nb in atom.GetNeighbors() if nb.GetSymbol() == "F"]
+        if fluorines:
+            for i in [atom.GetIdx()] + fluorines:
+                environment[i] = _FLUORINATED[len(fluorines) - 1]
+    for pattern in _HEADGROUPS:
+        for match in mol.GetSubstructMatches(pattern):
+            for i in match:
+                environment[i] = "headgroup"
+    return np.array([f"{s} ({e})" for s, e in zip(symbols, environment)], dtype=object)
+
+
+def atom_table(store, smiles):
+    # One row per atom of every molecule: molecule row, 1-based atom number,
+    # element, environment class and one column per ATOM_PROPERTIES label
+    # (NaN where the property does not line up with the atom list). Molecule
+    # i's atoms are rows store["[atoms]"].offsets[i] to offsets[i + 1].
+    elements = store["[atoms]"]
+    lengths = elements.lengths
+    environments = np.full(lengths.sum(), "unassigned", dtype=object)
+    for row in np.flatnonzero(lengths):
+        classes = environment_classes(smiles[row], elements[row])
+        if classes is not None:
+            environments[elements.offsets[row]:elements.offsets[row + 1]] = classes
+    table = pd.DataFrame({
+        "Molecule": np.repeat(np.arange(len(elements)), lengths),
+        "Atom": np.arange(lengths.sum()) - np.repeat(elements.starts, lengths) + 1,
+        "Element": np.asarray(elements.values, dtype=object),
+        "Environment": environments,
+    })
+    for key, label in ATOM_PROPERTIES.items():
+        table[label] = _gather(store[key], elements, np.nan)
+    return table
+
+
+def atom_histograms(table, label, by, bins=50):
+    # Histogram of column `label` for every group of column `by`, over bin
+    # edges shared by all groups. Returns (edges, counts) with counts a
+    # groups x bins DataFrame.
+    values = table[label].to_numpy()
+    keep = np.isfinite(values)
+    edges = np.histogram_bin_edges(values[keep], bins)
+    bin_index = np.clip(np.searchsorted(edges, values[keep], side="right") - 1, 0, bins - 1)
+    counts = (
+        pd.DataFrame({by: table[by].to_numpy()[keep], "bin": bin_index})
+        .groupby([by, "bin"]).size()
+        .unstack(fill_value=0)
+        .reindex(columns=range(bins), fill_value=0)
+    )
+    return edges, counts
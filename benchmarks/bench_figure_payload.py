@@ -0,0 +1,76 @@
+# bench_figure_payload.py
+# Reports the bytes Streamlit sends for the app's Plotly figures before and after
+# figures.compact_figure, using synthetic data shaped like the PFAS dataset.
+# The figures come from the app's own builders in figures.py; "before" builds
+# them with compact_figure switched off.
+#
+#   python benchmarks/bench_figure_payload.py [n_molecules] [n_modes] [n_local_modes]
+
+import contextlib
+import copy
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import figures
+from figures import compact_figure, figure_nbytes, scatter_figure, ir_figure, local_mode_figure, compare_figure
+from spectra import GRID, broaden
+
+
+@contextlib.contextmanager
+def uncompacted():
+    # The builders call compact_figure through the module, so this makes them
+    # return the figure as built.
+    figures.compact_figure = lambda fig, digits=6: fig
+    try:
+        yield
+    finally:
+        figures.compact_figure = compact_figure
+
+
+def builders(rng, n, n_modes, n_local):
+    # Figure label -> zero-argument builder.
+    x = rng.normal(size=n) * 10
+    y = rng.normal(size=n) * 0.1
+    names = ["CASRN: %07d-%02d-%d" % (i, i % 97, i % 10) for i in range(n)]
+    freqs = np.sort(rng.uniform(20, 3800, n_modes))
+    intens = rng.exponential(50, n_modes)
+    spectrum = broaden(freqs, intens, 20.0, "lorentzian")
+    local = pd.DataFrame({
+        "Normal Mode": np.repeat(freqs, n_local),
+        "Local Mode": np.tile(np.array(["L%d" % j for j in range(n_local)], dtype=object), n_modes),
+        "Contribution": (rng.dirichlet(np.ones(n_local), n_modes) * 100).ravel(),
+    })
+    compared = {"%d" % k: broaden(np.sort(rng.uniform(20, 3800, n_modes)), rng.exponential(50, n_modes)) for k in range(5)}
+    return {
+        "scatter + contour (%d points)" % n: lambda: scatter_figure(x, y, "x", "y", names),
+        "IR bars + Lorentzian (%d modes)" % n_modes: lambda: ir_figure(freqs, intens, 1.0, GRID, spectrum, "Lorentzian"),
+        "local mode stack (%dx%d)" % (n_modes, n_local): lambda: local_mode_figure(local),
+        "IR comparison (5 spectra)": lambda: compare_figure(GRID, compared),
+    }
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    n_modes = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    n_local = int(sys.argv[3]) if len(sys.argv) > 3 else 40
+    rng = np.random.default_rng(0)
+    print("%-34s %12s %12s %7s %9s" % ("figure", "before [B]", "after [B]", "ratio", "cost [ms]"))
+    for label, build in builders(rng, n, n_modes, n_local).items():
+        with uncompacted():
+            fig = build()
+        before = figure_nbytes(fig)
+        compacted = copy.deepcopy(fig)
+        start = time.perf_counter()
+        compact_figure(compacted)
+        elapsed = (time.perf_counter() - start) * 1000
+        after = figure_nbytes(build())
+        print("%-34s %12d %12d %6.2fx %9.1f" % (label, before, after, before / after, elapsed))
+
+
+if __name__ == "__main__":
+    main()
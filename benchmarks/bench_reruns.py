@@ -0,0 +1,104 @@
+# bench_reruns.py
+# Measures the server time of real reruns for typical interactions, before and
+# after the app was split into cached panels. rerun_app.py is run through
+# Streamlit's LocalScriptRunner, with widgets set as a user would, and every
+# rerun's total comes from the profiler's log line, so cache hits, the copies
+# st.cache_data makes on every hit and the serialisation of every chart are
+# all counted. Each mode runs in its own process, so caches start cold.
+#
+#   python benchmarks/bench_reruns.py [repeat]
+#
+# BENCH_MOLECULES, BENCH_MODES and BENCH_LOCAL_MODES size the synthetic data.
+
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+from unittest.mock import MagicMock
+
+MODES = ("before", "cache_data", "cache_resource")
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rerun_app.py")
+
+
+class _Totals(logging.Handler):
+
+    def __init__(self):
+        super().__init__()
+        self.totals = []
+
+    def emit(self, record):
+        event = json.loads(record.getMessage())
+        if event.get("event") == "rerun":
+            self.totals.append(event["total_ms"])
+
+
+def _interactions(r):
+    # Interaction name -> (widget key, value) for the r-th repetition. Values
+    # are new every time, so a changed input is a cache miss.
+    return {
+        "new selection": ("selected", r + 1),
+        "IR FWHM": ("fwhm", 21.0 + r),
+        "scatter axis": ("x", "p%d" % (2 + r % 10)),
+        "histogram bins": ("bins", 60 + 10 * r),
+        "3D view (no panel input)": ("view", "Partial Charges" if r % 2 == 0 else "Structure"),
+    }
+
+
+def measure(repeat):
+    # Runs in the child process, with BENCH_MODE set. Returns interaction ->
+    # rerun totals [ms].
+    from streamlit import config
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+    from streamlit.testing.local_script_runner import LocalScriptRunner
+
+    # The minimal runtime Streamlit's own script tests run against.
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    Runtime._instance = runtime
+    config.set_option("runner.postScriptGC", False)
+
+    profile_logger = logging.getLogger("pfas_studio.profile")
+    totals = _Totals()
+    profile_logger.handlers = [totals]
+    profile_logger.setLevel(logging.INFO)
+
+    tree = LocalScriptRunner(SCRIPT).run(timeout=300)
+    tree = tree.run(timeout=300)  # warm: a rerun with nothing changed
+    times = {}
+    for r in range(repeat):
+        for name, (key, value) in _interactions(r).items():
+            widget = tree.get_widget(key)
+            if widget is None:
+                raise RuntimeError(f"no widget with key {key!r}: the script failed, see {tree.get('exception')}")
+            before = len(totals.totals)
+            tree = widget.set_value(value).run(timeout=300)
+            if len(totals.totals) != before + 1:
+                raise RuntimeError(f"{name}: the rerun did not finish ({tree.get('exception')})")
+            times.setdefault(name, []).append(totals.totals[-1])
+    return times
+
+
+def main():
+    if os.environ.get("BENCH_MODE"):
+        print(json.dumps(measure(int(sys.argv[1]))))
+        return
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    results = {}
+    for mode in MODES:
+        out = subprocess.run([sys.executable, __file__, str(repeat)], env={**os.environ, "BENCH_MODE": mode},
+                             check=True, capture_output=True, text=True).stdout
+        results[mode] = json.loads(out.strip().splitlines()[-1])
+    print(f"median rerun [ms] over {repeat} repetitions")
+    print(f"{'interaction':28s}" + "".join(f"{mode:>16s}" for mode in MODES))
+    for name in results[MODES[0]]:
+        print(f"{name:28s}" + "".join(f"{statistics.median(results[mode][name]):16.1f}" for mode in MODES))
+
+
+if __name__ == "__main__":
+    main()
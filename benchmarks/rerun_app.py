@@ -0,0 +1,148 @@
+# rerun_app.py
+# Streamlit script run by bench_reruns.py: the app's scatter, IR, local mode
+# and atom histogram panels on synthetic data shaped like the PFAS dataset, so
+# reruns can be measured without a MongoDB. BENCH_MODE picks how the panels
+# are built:
+#   before          every figure rebuilt on every rerun, plus the unused
+#                   px.scatter the app used to build (the app before the split)
+#   cache_data      figures cached with st.cache_data (copied on every hit)
+#   cache_resource  figures cached with st.cache_resource (the app now)
+# Derived data (spectra, local mode table, histograms) is cached in both
+# cached modes, as in the app.
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+from streamlit_plotly_events import plotly_events
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from atomic import atom_histograms
+from figures import scatter_figure, ir_figure, local_mode_figure, atom_histogram_figure
+from profiler import start_rerun, finish_rerun, stage, timed
+from spectra import GRID, broaden
+
+MODE = os.environ.get("BENCH_MODE", "cache_resource")
+N = int(os.environ.get("BENCH_MOLECULES", "10000"))
+N_MODES = int(os.environ.get("BENCH_MODES", "300"))
+N_LOCAL = int(os.environ.get("BENCH_LOCAL_MODES", "40"))
+N_ATOMS = 20
+
+
+def uncached(**kwargs):
+    return lambda fn: fn
+
+
+data_cache = uncached if MODE == "before" else st.cache_data
+figure_cache = {"before": uncached, "cache_data": st.cache_data, "cache_resource": st.cache_resource}[MODE]
+
+start_rerun()
+
+
+@st.cache_resource
+def get_dataset():
+    rng = np.random.default_rng(0)
+    properties = pd.DataFrame({f"p{k}": rng.normal(size=N) * 10 ** (k % 4 - 2) for k in range(12)})
+    properties["name"] = ["%07d-%02d-%d" % (i, i % 97, i % 10) for i in range(N)]
+    atoms = pd.DataFrame({
+        "Molecule": np.repeat(np.arange(N), N_ATOMS),
+        "Atom": np.tile(np.arange(1, N_ATOMS + 1), N),
+        "Element": rng.choice(np.array(["C", "F", "O", "H"], dtype=object), N * N_ATOMS),
+        "Environment": rng.choice(np.array(["CF3", "CF2", "COOH", "CH2"], dtype=object), N * N_ATOMS),
+        "Partial Charge": rng.normal(size=N * N_ATOMS) * 0.3,
+    })
+    return properties, atoms
+
+
+def molecule(index):
+    # Per-molecule tensors, as molecule_tensors would return them.
+    rng = np.random.default_rng(index)
+    return {
+        "Frequency [cm⁻¹]": np.sort(rng.uniform(20, 3800, N_MODES)),
+        "IR Itensity [kmmol⁻¹]": rng.exponential(50, N_MODES),
+        "local [modes]": np.array(["L%d" % j for j in range(N_LOCAL)]),
+        "local [contributions]": (rng.dirichlet(np.ones(N_LOCAL), N_MODES) * 100).astype(np.float32),
+    }
+
+
+@timed()
+@data_cache(max_entries=256)
+def get_spectrum(index, shape, fwhm):
+    tensors = molecule(index)
+    return broaden(tensors["Frequency [cm⁻¹]"], tensors["IR Itensity [kmmol⁻¹]"], fwhm, shape)
+
+
+@timed()
+@data_cache(max_entries=64)
+def get_local_mode_table(index):
+    tensors = molecule(index)
+    freqs, modes = tensors["Frequency [cm⁻¹]"], tensors["local [modes]"].astype(object)
+    return pd.DataFrame({
+        "Normal Mode": np.repeat(freqs, len(modes)),
+        "Local Mode": np.tile(modes, len(freqs)),
+        "Contribution": tensors["local [contributions]"].astype(np.float64).ravel(),
+    })
+
+
+@timed()
+@data_cache(max_entries=64)
+def get_atom_histograms(bins):
+    return atom_histograms(get_dataset()[1], "Partial Charge", "Element", bins)
+
+
+@timed()
+@figure_cache(max_entries=64)
+def get_scatter_figure(x, y):
+    properties = get_dataset()[0]
+    return scatter_figure(properties[x], properties[y], x, y, ["CASRN: " + name for name in properties["name"]])
+
+
+@timed()
+@figure_cache(max_entries=256)
+def get_ir_figure(index, shape, fwhm):
+    tensors = molecule(index)
+    spectrum = get_spectrum(index, shape.lower(), fwhm)
+    return ir_figure(tensors["Frequency [cm⁻¹]"], tensors["IR Itensity [kmmol⁻¹]"], 1.0, GRID, spectrum, shape)
+
+
+@timed()
+@figure_cache(max_entries=64)
+def get_local_mode_figure(index):
+    return local_mode_figure(get_local_mode_table(index))
+
+
+@timed()
+@figure_cache(max_entries=64)
+def get_atom_histogram_figure(bins, index):
+    edges, counts = get_atom_histograms(bins)
+    atoms = get_dataset()[1].iloc[index * N_ATOMS:(index + 1) * N_ATOMS]
+    return atom_histogram_figure(edges, counts, "Partial Charge", atoms, str(index))
+
+
+properties = get_dataset()[0]
+columns = [c for c in properties.columns if c != "name"]
+# Stands in for a click in the scatter plot.
+index = st.number_input("Selected molecule", 0, N - 1, 0, key="selected")
+x = st.selectbox("X", columns, key="x")
+y = st.selectbox("Y", columns, index=1, key="y")
+shape = st.selectbox("Line Shape", ["Lorentzian", "Gaussian"], key="shape")
+fwhm = st.number_input("FWHM", 1.0, 200.0, 20.0, 1.0, key="fwhm")
+bins = st.number_input("Bins", 10, 200, 50, 10, key="bins")
+st.selectbox("3D Views", ["Structure", "Partial Charges"], key="view")
+
+if MODE == "before":
+    with stage("unused px.scatter"):
+        px.scatter(properties, x=x, y=y, hover_name="name")
+with stage("plotly_events: scatter"):
+    plotly_events(get_scatter_figure(x, y), override_height=700)
+with stage("plotly_chart: IR"):
+    st.plotly_chart(get_ir_figure(index, shape, fwhm), use_container_width=True)
+with stage("plotly_chart: local mode"):
+    st.plotly_chart(get_local_mode_figure(index), use_container_width=True)
+with stage("plotly_chart: atom histogram"):
+    st.plotly_chart(get_atom_histogram_figure(bins, index), use_container_width=True)
+
+finish_rerun()
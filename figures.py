@@ -0,0 +1,184 @@
+# figures.py
+# Plotly figures of the app's panels, and helpers for keeping their payloads
+# small before they are sent to the browser.
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.subplots import make_subplots
+
+# Trace attributes that hold one number per point.
+ARRAY_ATTRS = ("x", "y", "z", "customdata")
+MARKER_ARRAY_ATTRS = ("color", "size", "opacity")
+
+
+def round_significant(values, digits=6):
+    # Round to `digits` significant figures relative to the largest magnitude in
+    # the array. That is far below what a plot can resolve, and the shortest-repr
+    # float text Plotly writes for the rounded values is a fraction of the
+    # 17-digit text written for raw float64s.
+    values = np.asarray(values, dtype=float)
+    finite = np.isfinite(values)
+    if not finite.any():
+        return values
+    magnitude = np.abs(values[finite]).max()
+    if magnitude == 0:
+        return values
+    decimals = digits - 1 - int(np.floor(np.log10(magnitude)))
+    return np.round(values, decimals)
+
+
+def _numeric_array(value):
+    if value is None or isinstance(value, (str, bytes, dict)) or np.isscalar(value):
+        return None
+    try:
+        array = np.asarray(value)
+    except (TypeError, ValueError):
+        return None
+    if array.dtype.kind != "f" or array.size == 0:
+        return None
+    return array
+
+
+def compact_figure(fig, digits=6):
+    # Round every float array of every trace in place and return the figure,
+    # so it can wrap the figure argument of st.plotly_chart / plotly_events.
+    for trace in fig.data:
+        for attr in ARRAY_ATTRS:
+            array = _numeric_array(getattr(trace, attr, None))
+            if array is not None:
+                setattr(trace, attr, round_significant(array, digits))
+        marker = getattr(trace, "marker", None)
+        if marker is None:
+            continue
+        for attr in MARKER_ARRAY_ATTRS:
+            array = _numeric_array(getattr(marker, attr, None))
+            if array is not None:
+                setattr(marker, attr, round_significant(array, digits))
+    return fig
+
+
+def figure_nbytes(fig):
+    # Size of the JSON spec Streamlit ships for the figure.
+    return len(pio.to_json(fig, validate=False).encode("utf-8"))
+
+
+# Figure builders of the app's panels. They take plain arrays/frames, so the
+# app can cache them per panel inputs and benchmarks can call them directly.
+
+def scatter_figure(x_values, y_values, x, y, names):
+    f = go.Figure()
+    f.add_trace(go.Histogram2dContour(
+        x = x_values,
+        y = y_values,
+        colorscale = 'Teal',
+        reversescale=False,
+        showscale=False,
+        hoverinfo='skip',
+        xaxis = 'x',
+        yaxis = 'y'
+    ))
+    f.add_trace(go.Scatter(
+        x = x_values,
+        y = y_values,
+        xaxis = 'x',
+        yaxis = 'y',
+        mode = 'markers',
+        text=names,
+        name='',
+        hovertemplate="%{text}",
+        marker = dict(
+            color = 'rgba(0,0,0,1.0)',
+            size = 3
+        )
+    ))
+    f.update_layout(
+        autosize = False,
+        xaxis = dict(
+            zeroline = False,
+            domain = [0,0.85],
+            showgrid = False,
+            title = x
+        ),
+        yaxis = dict(
+            zeroline = False,
+            domain = [0,0.85],
+            showgrid = False,
+            title = y
+        ),
+        margin = dict(
+            b = 80,
+            l = 80,
+            t = 10,
+            r = 20
+        ),
+        width = 450,
+        hovermode = 'closest',
+        showlegend = False
+    )
+    return compact_figure(f)
+
+
+def ir_figure(freqs, intensities, scale=1.0, grid=None, spectrum=None, line_shape=None):
+    # Stick spectrum, with the broadened spectrum on a secondary axis if given.
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig.update_layout(height=275)
+    fig.add_trace(
+        go.Bar(x=np.asarray(freqs)*scale, y=intensities,  name="IR Itensity [kJ/mol]"),
+        secondary_y=False
+    )
+    if spectrum is not None:
+        fig.add_trace(
+            go.Scatter(x=grid, y=spectrum, mode="lines", name=line_shape),
+            secondary_y=True
+        )
+        fig.update_yaxes(title_text="Molar Absorptivity [km/mol/cm⁻¹]", showgrid=False, rangemode="tozero", secondary_y=True)
+    fig.update_xaxes(title_text="Frequency [cm⁻¹]")
+    fig.update_yaxes(title_text="Integrated Molar Absorptivity [km/mol]", secondary_y=False)
+    fig.update_layout(margin = dict(l = 0, r = 0, t = 25, b = 0))
+    fig.update(layout_showlegend=False)
+    return compact_figure(fig)
+
+
+def local_mode_figure(df):
+    fig_bar = px.bar(df, x = "Normal Mode", color = "Local Mode", y = "Contribution", barmode='stack')
+    # Update ylabel in fig_bar to say "Contribution [%]"
+    fig_bar.update_yaxes(title_text="Contribution [%]")
+    fig_bar.update_xaxes(title_text="Frequency [cm⁻¹]")
+    fig_bar.update_layout(
+        coloraxis_colorbar = dict(
+            title = "Local Mode",
+        )
+    )
+    return compact_figure(fig_bar)
+
+
+def compare_figure(grid, spectra):
+    # `spectra` maps a trace name to its broadened spectrum on `grid`.
+    fig_cmp = go.Figure(layout = {'height': 400})
+    for name, spectrum in spectra.items():
+        fig_cmp.add_trace(go.Scatter(x=grid, y=spectrum, mode="lines", name=name))
+    fig_cmp.update_xaxes(title_text="Frequency [cm⁻¹]")
+    fig_cmp.update_yaxes(title_text="Molar Absorptivity [km/mol/cm⁻¹]")
+    fig_cmp.update_layout(margin = dict(l = 0, r = 0, t = 25, b = 0), legend = dict(orientation = "h"))
+    return compact_figure(fig_cmp)
+
+
+def atom_histogram_figure(edges, counts, label, atoms=None, atoms_name=None):
+    # Stacked histograms (counts: groups x bins over `edges`), with `atoms`
+    # (rows of the per-atom table) drawn as a rug along the axis.
+    centers = 0.5 * (edges[1:] + edges[:-1])
+    fig_atoms = go.Figure(layout = {'height': 500})
+    for group, row in counts.iterrows():
+        fig_atoms.add_trace(go.Bar(x=centers, y=row.to_numpy(), width=edges[1] - edges[0], name=group))
+    if atoms is not None:
+        fig_atoms.add_trace(go.Scatter(
+            x=atoms[label], y=[0] * len(atoms), mode="markers", name=atoms_name,
+            text=[f"Atom {a}: {e}" for a, e in zip(atoms["Atom"], atoms["Environment"])],
+            hovertemplate="%{text}<br>%{x}",
+            marker=dict(symbol="line-ns-open", size=16, color="black")))
+    fig_atoms.update_layout(barmode="stack", bargap=0, margin = dict(l = 0, r = 0, t = 25, b = 0), legend = dict(orientation = "h"))
+    fig_atoms.update_xaxes(title_text=label)
+    fig_atoms.update_yaxes(title_text="Atoms")
+    return compact_figure(fig_atoms)
@@ -0,0 +1,137 @@
+# memory.py
+# Memory held by the app's caches, per group of cached functions (dataset,
+# fingerprints, artifacts, HTML, ...), and by the current session's state.
+#
+# st.cache_data keeps every entry as pickled bytes, so its size is exact and
+# cheap to read. st.cache_resource keeps live objects, which are sized with
+# Pympler once per entry: resources are not mutated after they are built.
+# Memory-mapped arrays (the tensor store) count only their headers, since
+# their pages belong to the OS page cache rather than the heap.
+#
+# High-water marks in MB per group (or "total") are read from a [memory]
+# table in the secrets, e.g.
+#
+#   [memory]
+#   artifacts = 512
+#   total = 2048
+#
+# Only the evictable groups (per-molecule artifacts, figures, HTML) are held
+# to them: a group over its mark, or all of them together over "total", has
+# its largest caches cleared until it is under. The dataset and fingerprint
+# resources are reported but never evicted, since every rerun would rebuild
+# them straight away.
+
+import time
+
+import pandas as pd
+import streamlit as st
+from pympler import asizeof
+from prometheus_client import Gauge, Histogram
+
+from metrics import CACHE_EVICTIONS, REGISTRY, forget, streamlit_caches
+
+# Seconds between two reports; sizing runs at the end of a rerun.
+REPORT_INTERVAL = 30
+
+CACHE_BYTES = Gauge(
+    "pfas_studio_cache_bytes", "Memory held by a cached function's entries.",
+    ["group", "function"], registry=REGISTRY)
+CACHE_ENTRIES = Gauge(
+    "pfas_studio_cache_entries", "Entries held by a cached function.",
+    ["group", "function"], registry=REGISTRY)
+SESSION_STATE_BYTES = Histogram(
+    "pfas_studio_session_state_bytes", "Size of a session's st.session_state, sampled with each report.",
+    buckets=tuple(4.0 ** k * 256 for k in range(10)), registry=REGISTRY)
+
+# id(cache_resource entry) -> its size, for the entries still held.
+_resource_sizes = {}
+_last = {"time": 0.0, "report": None}
+
+
+def _entry_bytes(value):
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    key = id(value)
+    if key not in _resource_sizes:
+        _resource_sizes[key] = asizeof.asizeof(value)
+    return _resource_sizes[key]
+
+
+def cache_report(groups):
+    # `groups` maps a group name to its cached functions. Returns one row per
+    # function: Group, Function, Entries, Bytes.
+    rows, alive = [], set()
+    for group, functions in groups.items():
+        for fn in functions:
+            name = f"{fn.__module__}.{fn.__qualname__}"
+            entries, size = 0, 0
+            for store, _ in streamlit_caches(name):
+                for value in list(store.values()):
+                    alive.add(id(value))
+                    entries += 1
+                    size += _entry_bytes(value)
+            rows.append({"Group": group, "Function": fn.__name__, "Entries": entries, "Bytes": size})
+            CACHE_BYTES.labels(group, fn.__name__).set(size)
+            CACHE_ENTRIES.labels(group, fn.__name__).set(entries)
+    for key in set(_resource_sizes) - alive:
+        _resource_sizes.pop(key, None)
+    return pd.DataFrame(rows, columns=["Group", "Function", "Entries", "Bytes"])
+
+
+def session_bytes():
+    # Size of the running session's st.session_state.
+    return asizeof.asizeof({key: st.session_state[key] for key in st.session_state})
+
+
+def high_water_marks():
+    # Group (or "total") -> bytes, from the [memory] table of the secrets.
+    try:
+        marks = dict(st.secrets.get("memory", {}))
+    except FileNotFoundError:
+        return {}
+    return {group: float(mb) * 2 ** 20 for group, mb in marks.items()}
+
+
+def evict(report, groups, marks, evictable):
+    # Clears the largest caches of every `evictable` group over its mark (and,
+    # over the "total" mark, the largest evictable caches overall). Marks of
+    # other groups are ignored. Returns the cleared functions.
+    functions = {fn.__name__: fn for fns in groups.values() for fn in fns}
+    report = report[report["Group"].isin(evictable)]
+    cleared = []
+    for group, mark in marks.items():
+        if group != "total" and group not in evictable:
+            continue
+        rows = report if group == "total" else report[report["Group"] == group]
+        rows = rows[~rows["Function"].isin(cleared)]
+        held = rows["Bytes"].sum()
+        for _, row in rows.sort_values("Bytes", ascending=False).iterrows():
+            if held <= mark or row["Bytes"] == 0:
+                break
+            forget(row["Function"], functions[row["Function"]].clear)
+            CACHE_EVICTIONS.labels(row["Function"], "high_water").inc(row["Entries"])
+            held -= row["Bytes"]
+            cleared.append(row["Function"])
+    return cleared
+
+
+def check_memory(groups, evictable, force=False):
+    # Sizes the caches at most every REPORT_INTERVAL seconds (or when `force`d,
+    # e.g. for the debug panel) and evicts the `evictable` groups over the
+    # high-water marks. Returns the latest report.
+    now = time.monotonic()
+    if force or _last["report"] is None or now - _last["time"] >= REPORT_INTERVAL:
+        report = cache_report(groups)
+        SESSION_STATE_BYTES.observe(session_bytes())
+        marks = high_water_marks()
+        if marks and evict(report, groups, marks, evictable):
+            report = cache_report(groups)
+        _last.update(time=now, report=report)
+    return _last["report"]
+
+
+def memory_table(report):
+    # The report summed per group, largest first, in MB, for the debug panel.
+    table = report.groupby("Group")[["Entries", "Bytes"]].sum().sort_values("Bytes", ascending=False)
+    table["MB"] = (table.pop("Bytes") / 2 ** 20).round(2)
+    return table
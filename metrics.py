@@ -0,0 +1,166 @@
+# metrics.py
+# Prometheus metrics for production monitoring, served by prometheus_client's
+# own HTTP server on a side port (PFAS_STUDIO_METRICS_PORT, default 9464, 0 to
+# disable), so a Prometheus scrape or `curl localhost:9464/metrics` reads them.
+#
+# Stage latencies (get_data, get_files, get_fingerprints, get_similar, panels,
+# ...) come from the rerun profile and are exported once the rerun finishes
+# (`observe_rerun`). Functions decorated with `counted` below their
+# st.cache_data/st.cache_resource decorator report cache hits, misses and
+# evictions.
+#
+# Evictions are read off the caches themselves: when a rerun finishes, the
+# keys a counted cache held at the previous check and no longer holds were
+# dropped to make room (the app sets no ttl). Clears by the memory high-water
+# marks are counted where they happen and `forget`-ten here.
+
+import functools
+import logging
+import os
+import threading
+
+import prometheus_client
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+
+from profiler import current
+
+METRICS_PORT = int(os.environ.get("PFAS_STUDIO_METRICS_PORT", "9464"))
+
+logger = logging.getLogger("pfas_studio.metrics")
+
+# The app's own registry, so /metrics carries exactly the metrics below.
+REGISTRY = CollectorRegistry()
+
+_SECONDS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+_BYTES = tuple(4.0 ** k * 1024 for k in range(11))  # 1 KiB .. 1 GiB
+
+STAGE_SECONDS = Histogram(
+    "pfas_studio_stage_seconds", "Duration of one profiled stage of a rerun (cache hits included).",
+    ["stage"], buckets=_SECONDS, registry=REGISTRY)
+RERUN_SECONDS = Histogram(
+    "pfas_studio_rerun_seconds", "Duration of a whole script rerun.",
+    buckets=_SECONDS, registry=REGISTRY)
+GRIDFS_BYTES = Histogram(
+    "pfas_studio_gridfs_read_bytes", "Compressed size of a file read from GridFS.",
+    ["kind"], buckets=_BYTES, registry=REGISTRY)
+DECOMPRESS_SECONDS = Histogram(
+    "pfas_studio_decompress_seconds", "Time to inflate a file read from GridFS.",
+    ["kind"], buckets=_SECONDS, registry=REGISTRY)
+HTML_BYTES = Histogram(
+    "pfas_studio_html_bytes", "Size of a rendered HTML block.",
+    ["template"], buckets=_BYTES, registry=REGISTRY)
+CACHE_REQUESTS = Counter(
+    "pfas_studio_cache_requests", "Calls of a cached function by outcome (hit or miss).",
+    ["function", "result"], registry=REGISTRY)
+CACHE_EVICTIONS = Counter(
+    "pfas_studio_cache_evictions", "Entries a cached function's cache dropped to make room.",
+    ["function", "reason"], registry=REGISTRY)
+ACTIVE_SESSIONS = Gauge(
+    "pfas_studio_active_sessions", "Browser sessions connected to this server.",
+    registry=REGISTRY)
+
+# Name -> display name ("module.qualname") of the functions decorated with
+# `counted`, and the cache keys each held at the last check.
+_COUNTED = {}
+_keys = {}
+_keys_lock = threading.Lock()
+
+
+def _active_sessions():
+    from streamlit.runtime import Runtime
+    if not Runtime.exists():
+        return 0
+    try:
+        return Runtime.instance()._session_mgr.num_active_sessions()
+    except AttributeError:
+        return float("nan")
+
+
+ACTIVE_SESSIONS.set_function(_active_sessions)
+
+
+def streamlit_caches(name):
+    # The in-memory stores of the st.cache_data/st.cache_resource caches of the
+    # function with display name `name` ("module.qualname"), as (store,
+    # max_entries) pairs. Streamlit keeps these private, so this reads its
+    # internals and yields nothing if they move.
+    from streamlit.runtime.caching import cache_data_api, cache_resource_api
+    for registry, attribute in ((cache_data_api._data_caches, "storage"), (cache_resource_api._resource_caches, None)):
+        for cache in list(getattr(registry, "_function_caches", {}).values()):
+            if cache.display_name != name:
+                continue
+            owner = getattr(cache, attribute) if attribute else cache
+            store = getattr(owner, "_mem_cache", None)
+            if store is not None:
+                yield store, store.maxsize
+
+
+def counted(fn):
+    # Applied below st.cache_data/st.cache_resource, so it only runs on a cache
+    # miss. Misses are counted here; hits are the function's profiled calls
+    # less its misses, and evictions are the keys its cache dropped, both
+    # counted when the rerun finishes.
+    name = fn.__name__
+    _COUNTED[name] = f"{fn.__module__}.{fn.__qualname__}"
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        CACHE_REQUESTS.labels(name, "miss").inc()
+        profile = current()
+        if profile is not None:
+            profile.count(f"cache_miss.{name}")
+        return fn(*args, **kwargs)
+    return wrapper
+
+
+def _cache_keys(display_name):
+    return {key for store, _ in streamlit_caches(display_name) for key in list(store.keys())}
+
+
+def count_evictions():
+    # Counts the keys every counted cache dropped since the last call.
+    with _keys_lock:
+        for name, display_name in _COUNTED.items():
+            keys = _cache_keys(display_name)
+            dropped = len(_keys.get(name, set()) - keys)
+            if dropped:
+                CACHE_EVICTIONS.labels(name, "max_entries").inc(dropped)
+            _keys[name] = keys
+
+
+def forget(name, clear):
+    # Runs `clear` (e.g. a cached function's .clear) without its dropped keys
+    # being counted as max_entries evictions.
+    with _keys_lock:
+        clear()
+        _keys[name] = _cache_keys(_COUNTED[name]) if name in _COUNTED else set()
+
+
+def observe_rerun(profile):
+    # Exports a finished rerun's stage timings, cache hits and evictions.
+    if profile is None:
+        return
+    count_evictions()
+    RERUN_SECONDS.observe(profile.elapsed() / 1000)
+    calls = {}
+    for name, _, _, ms in profile.stages:
+        STAGE_SECONDS.labels(name).observe(ms / 1000)
+        if name in _COUNTED:
+            calls[name] = calls.get(name, 0) + 1
+    for name, n in calls.items():
+        hits = n - profile.counters.get(f"cache_miss.{name}", 0)
+        if hits > 0:
+            CACHE_REQUESTS.labels(name, "hit").inc(hits)
+
+
+def start_server(port=METRICS_PORT):
+    # Serves /metrics on `port`; returns whether the server is running. Call it
+    # once per process (e.g. from an st.cache_resource function).
+    if not port:
+        return False
+    try:
+        prometheus_client.start_http_server(port, registry=REGISTRY)
+    except OSError as e:
+        logger.warning("metrics server not started on port %d: %s", port, e)
+        return False
+    return True
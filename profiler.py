@@ -0,0 +1,143 @@
+# profiler.py
+# Per-rerun timing of the app's stages. `stage` (a context manager) and `timed`
+# (a decorator) record how long each step of a rerun takes; `finish_rerun`
+# writes the rerun as one JSON line to the "pfas_studio.profile" logger and,
+# when debugging is enabled (?debug=1 or `debug = true` in the secrets), draws
+# a waterfall of it in the sidebar.
+#
+# Streamlit runs every session's script in its own thread, so the profile of
+# the running rerun is kept thread-local.
+
+import contextlib
+import functools
+import json
+import logging
+import threading
+import time
+
+import plotly.graph_objects as go
+import streamlit as st
+
+logger = logging.getLogger("pfas_studio.profile")
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+_local = threading.local()
+
+
+class Profile:
+    # Stages of one rerun as (name, depth, start [ms], duration [ms]), plus
+    # free-form counters other modules can add to (e.g. queries issued).
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.stages = []
+        self.counters = {}
+        self.open = []  # names of the stages running now, outermost first
+
+    @property
+    def depth(self):
+        return len(self.open)
+
+    def elapsed(self):
+        return (time.perf_counter() - self.origin) * 1000
+
+    def count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+
+def start_rerun():
+    _local.profile = Profile()
+    return _local.profile
+
+
+def current():
+    # The running rerun's profile, or None outside a profiled rerun.
+    return getattr(_local, "profile", None)
+
+
+@contextlib.contextmanager
+def stage(name):
+    # with stage("get_files"): ...  Nested stages are indented in the waterfall.
+    profile = current()
+    if profile is None:
+        yield
+        return
+    start = profile.elapsed()
+    depth = profile.depth
+    profile.open.append(name)
+    try:
+        yield
+    finally:
+        profile.open.pop()
+        profile.stages.append((name, depth, start, profile.elapsed() - start))
+
+
+def timed(name=None):
+    # Decorator recording every call as a stage. Applied on top of
+    # st.cache_data/st.cache_resource it times cache hits and misses alike.
+    def decorate(fn):
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with stage(label):
+                return fn(*args, **kwargs)
+
+        if hasattr(fn, "clear"):
+            wrapper.clear = fn.clear
+        return wrapper
+    return decorate
+
+
+def debug_enabled():
+    if st.experimental_get_query_params().get("debug", ["0"])[0] not in ("", "0", "false"):
+        return True
+    try:
+        return bool(st.secrets.get("debug", False))
+    except FileNotFoundError:
+        return False
+
+
+def waterfall(profile):
+    stages = sorted(profile.stages, key=lambda s: s[2])
+    labels = [" " * depth + name for name, depth, _, _ in stages]
+    fig = go.Figure(go.Bar(
+        y=labels,
+        x=[duration for _, _, _, duration in stages],
+        base=[start for _, _, start, _ in stages],
+        orientation="h",
+        hovertemplate="%{y}: %{x:.1f} ms<extra></extra>",
+    ))
+    fig.update_yaxes(autorange="reversed", tickfont=dict(size=10))
+    fig.update_xaxes(title_text="ms since rerun start")
+    fig.update_layout(height=max(200, 18 * len(stages) + 60), margin=dict(l=0, r=0, t=10, b=0))
+    return fig
+
+
+def finish_rerun():
+    # Logs (and in debug mode draws) the running rerun's profile and returns it.
+    profile = current()
+    if profile is None:
+        return None
+    total = profile.elapsed()
+    logger.info(json.dumps({
+        "event": "rerun",
+        "time": time.time(),
+        "total_ms": round(total, 2),
+        "stages": [{"name": n, "depth": d, "start_ms": round(s, 2), "ms": round(t, 2)} for n, d, s, t in profile.stages],
+        "counters": profile.counters,
+    }, ensure_ascii=False))
+    if debug_enabled():
+        with st.sidebar:
+            st.subheader("Rerun profile")
+            st.write(f"Total {total:.1f} ms")
+            st.plotly_chart(waterfall(profile), use_container_width=True)
+            if profile.counters:
+                st.json(profile.counters)
+    _local.profile = None
+    return profile
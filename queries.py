@@ -0,0 +1,100 @@
+# queries.py
+# Monitoring of the MongoDB commands the app issues, through pymongo's command
+# listener API: pass `QueryListener()` in the client's event_listeners.
+#
+# Every command is recorded with its name, collection, duration, reply size
+# and the profiler stage that issued it:
+# - in the running rerun's profile, as a "mongo: <command> <collection>"
+#   stage under the stage that issued it and as counters (commands per
+#   command/collection, total ms, reply bytes), which end up in the rerun's
+#   log line and the debug waterfall, so e.g. one find per file in get_files
+#   is visible at a glance;
+# - as one JSON line per command on the "pfas_studio.mongo" logger at DEBUG;
+# - in the Prometheus metrics.
+#
+# pymongo calls the listener on the thread that runs the command, i.e. the
+# session's script thread, so the profile of the issuing rerun is at hand.
+
+import json
+import logging
+import time
+
+import bson
+from prometheus_client import Histogram
+from pymongo import monitoring
+
+from metrics import REGISTRY
+from profiler import current
+
+logger = logging.getLogger("pfas_studio.mongo")
+
+MONGO_SECONDS = Histogram(
+    "pfas_studio_mongo_command_seconds", "Duration of a MongoDB command.",
+    ["command", "collection"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+    registry=REGISTRY)
+MONGO_REPLY_BYTES = Histogram(
+    "pfas_studio_mongo_reply_bytes", "BSON size of a MongoDB command's reply.",
+    ["command", "collection"], buckets=tuple(4.0 ** k * 256 for k in range(12)), registry=REGISTRY)
+
+
+def _collection(command_name, command):
+    # The collection a command targets, or "" for database/admin commands.
+    if command_name == "getMore":
+        return command.get("collection", "")
+    target = command.get(command_name)
+    return target if isinstance(target, str) else ""
+
+
+class QueryListener(monitoring.CommandListener):
+
+    def __init__(self):
+        # (connection id, request id) -> (command, collection, stage, profile,
+        # start [ms into the profile]) of the commands in flight.
+        self._pending = {}
+
+    def started(self, event):
+        profile = current()
+        self._pending[(event.connection_id, event.request_id)] = (
+            event.command_name,
+            _collection(event.command_name, event.command),
+            profile.open[-1] if profile is not None and profile.open else None,
+            profile,
+            profile.elapsed() if profile is not None else None,
+        )
+
+    def succeeded(self, event):
+        self._record(event, len(bson.encode(event.reply)), None)
+
+    def failed(self, event):
+        self._record(event, 0, str(event.failure))
+
+    def _record(self, event, reply_bytes, failure):
+        pending = self._pending.pop((event.connection_id, event.request_id), None)
+        if pending is None:
+            return
+        command, collection, stage, profile, start = pending
+        ms = event.duration_micros / 1000
+        MONGO_SECONDS.labels(command, collection).observe(ms / 1000)
+        MONGO_REPLY_BYTES.labels(command, collection).observe(reply_bytes)
+        if profile is not None:
+            # The listener is called once the reply is decoded, so the stage
+            # ends now rather than at start + duration.
+            profile.stages.append((f"mongo: {command} {collection}".rstrip(), profile.depth, start, profile.elapsed() - start))
+            profile.count(f"mongo.{command}.{collection}" if collection else f"mongo.{command}")
+            profile.count("mongo.commands")
+            profile.count("mongo.ms", round(ms, 3))
+            profile.count("mongo.reply_bytes", reply_bytes)
+            if failure is not None:
+                profile.count("mongo.failed")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(json.dumps({
+                "event": "mongo",
+                "time": time.time(),
+                "command": command,
+                "collection": collection,
+                "ms": round(ms, 3),
+                "reply_bytes": reply_bytes,
+                "stage": stage,
+                "failure": failure,
+            }, ensure_ascii=False))
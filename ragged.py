@@ -0,0 +1,137 @@
+# ragged.py
+# Columnar storage for the per-molecule tensor properties. Every property is one
+# flat value array plus offsets into it, so a molecule's data is a zero-copy
+# slice and cross-molecule analysis runs on whole arrays.
+
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from atomic import atom_elements
+
+# Tensor property key -> (dtype, dimensions per molecule). Bulky matrices are
+# float32; values that are shown as text or aggregated stay float64.
+TENSOR_SCHEMA = {
+    "[atoms]": (str, 1),
+    "[fp]": (np.float64, 1),
+    "[fm]": (np.float64, 1),
+    "[f0]": (np.float64, 1),
+    "Partial Charge [e]": (np.float64, 1),
+    "Frequency [cm⁻¹]": (np.float64, 1),
+    "IR Itensity [kmmol⁻¹]": (np.float64, 1),
+    "Reduced Mass [amu]": (np.float64, 1),
+    "dx [Å]": (np.float32, 2),
+    "dy [Å]": (np.float32, 2),
+    "dz [Å]": (np.float32, 2),
+    "local [modes]": (str, 1),
+    "local [contributions]": (np.float32, 2),
+}
+
+
+class Ragged:
+    # One property of every molecule: `values` holds all entries back to back,
+    # molecule i owns values[offsets[i]:offsets[i + 1]], reshaped to shapes[i].
+
+    __slots__ = ("values", "offsets", "shapes")
+
+    def __init__(self, values, offsets, shapes):
+        self.values = values
+        self.offsets = offsets
+        self.shapes = shapes
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return self.values[self.offsets[i]:self.offsets[i + 1]].reshape(self.shapes[i])
+
+    @property
+    def lengths(self):
+        return np.diff(self.offsets)
+
+    @property
+    def starts(self):
+        return self.offsets[:-1]
+
+    @classmethod
+    def from_arrays(cls, arrays, dtype, ndim):
+        # `arrays` holds one array (or None for missing data) per molecule.
+        shapes = np.zeros((len(arrays), ndim), dtype=np.int64)
+        for i, array in enumerate(arrays):
+            if array is not None:
+                shapes[i] = array.shape
+        offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        np.cumsum(shapes.prod(axis=1), out=offsets[1:])
+        present = [array.ravel() for array in arrays if array is not None]
+        values = np.concatenate(present) if present else np.empty(0, dtype=dtype)
+        return cls(values.astype(dtype, copy=False), offsets, shapes)
+
+
+def _convert(key, value, dtype, ndim):
+    # One molecule's nested list as an array, or None if it is missing or malformed.
+    try:
+        if key == "[atoms]":
+            array = atom_elements({key: value})
+        else:
+            array = np.asarray(value, dtype=dtype)
+    except (TypeError, ValueError):
+        return None
+    if array is None or array.ndim != ndim or array.size == 0:
+        return None
+    return array
+
+
+def build_tensor_store(path, tensor_props, n):
+    # `tensor_props` yields (row, tensor_properties) pairs for rows 0..n-1 in any
+    # order. The store is written under `path` and returned memory-mapped.
+    columns = {key: [None] * n for key in TENSOR_SCHEMA}
+    for row, tensor in tensor_props:
+        for key, (dtype, ndim) in TENSOR_SCHEMA.items():
+            if key in tensor:
+                columns[key][row] = _convert(key, tensor[key], dtype, ndim)
+    store = {key: Ragged.from_arrays(columns.pop(key), dtype, ndim) for key, (dtype, ndim) in TENSOR_SCHEMA.items()}
+    save_tensor_store(path, store)
+    return load_tensor_store(path)
+
+
+def save_tensor_store(path, store):
+    # One directory of .npy files plus a manifest mapping property keys to file
+    # stems, written to a private directory beside `path` and moved into place
+    # when complete. If another process got there first, its store is kept.
+    tmp = tempfile.mkdtemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=os.path.dirname(path) or ".")
+    manifest = {}
+    for i, (key, ragged) in enumerate(store.items()):
+        stem = f"p{i}"
+        for field in Ragged.__slots__:
+            np.save(os.path.join(tmp, f"{stem}.{field}.npy"), getattr(ragged, field))
+        manifest[key] = stem
+    with open(os.path.join(tmp, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    try:
+        os.rename(tmp, path)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)
+        if not os.path.isfile(os.path.join(path, "manifest.json")):
+            raise
+
+
+def load_tensor_store(path):
+    with open(os.path.join(path, "manifest.json"), encoding="utf-8") as f:
+        manifest = json.load(f)
+    return {
+        key: Ragged(*(np.load(os.path.join(path, f"{stem}.{field}.npy"), mmap_mode="r") for field in Ragged.__slots__))
+        for key, stem in manifest.items()
+    }
+
+
+def molecule_tensors(store, i):
+    # Molecule i's tensor properties as array views, keyed like the
+    # tensor_properties document. Properties it does not have are left out.
+    tensors = {}
+    for key, ragged in store.items():
+        if ragged.offsets[i + 1] > ragged.offsets[i]:
+            tensors[key] = ragged[i]
+    return tensors
@@ -0,0 +1,40 @@
+# render.py
+# Jinja2 templates for the HTML blocks passed to st.components.v1.html.
+# The environment is built once per process and never re-stats the template
+# files, so each template is compiled to Python bytecode exactly once.
+
+import os
+
+import jinja2
+from markupsafe import Markup
+
+from assets import MissingAssetError, script_tag
+from metrics import HTML_BYTES
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+_env = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(TEMPLATE_DIR),
+    autoescape=jinja2.select_autoescape(["html"]),
+    auto_reload=False,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+
+
+def _script_tag(name):
+    # A missing vendored library leaves its message in place of the block
+    # rather than failing the whole rerun.
+    try:
+        return Markup(script_tag(name))
+    except MissingAssetError as e:
+        return Markup('<p style="color: #b00020">{}</p>').format(str(e))
+
+
+_env.globals["script_tag"] = _script_tag
+
+
+def render(name, **context):
+    html = _env.get_template(name).render(**context)
+    HTML_BYTES.labels(name).observe(len(html.encode("utf-8")))
+    return html
@@ -0,0 +1,29 @@
+# fetch_assets.py
+# Download the pinned third-party JS listed in assets.VENDORED, and its
+# licences (assets.LICENSES), into ./static. Commit the files it writes, so
+# deployments (air-gapped ones included) never reach a CDN; run it again after
+# changing a pinned version.
+#
+#   python scripts/fetch_assets.py
+
+import hashlib
+import os
+import sys
+import urllib.request
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from assets import LICENSES, STATIC_DIR, VENDORED
+
+
+def main():
+    os.makedirs(STATIC_DIR, exist_ok=True)
+    for name, url in {**VENDORED, **LICENSES}.items():
+        with urllib.request.urlopen(url) as response:
+            body = response.read()
+        with open(os.path.join(STATIC_DIR, name), "wb") as fh:
+            fh.write(body)
+        print(f"{name}: {len(body)} bytes, sha256 {hashlib.sha256(body).hexdigest()} from {url}")
+
+
+if __name__ == "__main__":
+    main()
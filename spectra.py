@@ -0,0 +1,123 @@
+# spectra.py
+# Broadened IR spectra on a fixed wavenumber grid, so spectra of different
+# molecules can be compared point by point.
+
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+# Wavenumber grid [cm⁻¹] shared by every broadened spectrum.
+GRID = np.arange(0.0, 4000.0 + 2.0, 2.0)
+
+LINE_SHAPES = ("lorentzian", "gaussian")
+
+# FWHMs [cm⁻¹] the dataset-wide similarity index is built for, one index per
+# (line shape, FWHM), so the number of full-dataset indexes stays fixed.
+INDEX_FWHMS = (10.0, 20.0, 40.0)
+
+# Seconds after which an index temporary nobody renamed is taken to be left
+# by an interrupted build; far longer than building any index takes.
+TMP_MAX_AGE = 3600
+
+
+def line_shape_kernel(delta, fwhm, shape):
+    # Area-normalised line shape evaluated at offsets `delta` [cm⁻¹].
+    if shape == "lorentzian":
+        gamma = 0.5 * fwhm
+        return gamma / np.pi / (delta ** 2 + gamma ** 2)
+    if shape == "gaussian":
+        sigma = fwhm / (2.0 * np.sqrt(2.0 * np.log(2.0)))
+        return np.exp(-0.5 * (delta / sigma) ** 2) / (sigma * np.sqrt(2.0 * np.pi))
+    raise ValueError(f"unknown line shape {shape!r}, expected one of {LINE_SHAPES}")
+
+
+def broaden(freqs, intensities, fwhm=20.0, shape="lorentzian", scale=1.0, grid=GRID):
+    # Convolve the stick spectrum with the line shape on `grid` using one
+    # (grid, modes) broadcast kernel. Each band keeps its integrated intensity,
+    # so the result is in km mol⁻¹ per cm⁻¹. Imaginary (negative) modes are dropped.
+    freqs = np.asarray(freqs, dtype=np.float64) * scale
+    intensities = np.asarray(intensities, dtype=np.float64)
+    real = freqs > 0
+    kernel = line_shape_kernel(grid[:, None] - freqs[None, real], fwhm, shape)
+    return kernel @ intensities[real]
+
+
+def normalize_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def build_spectrum_index(path, spectra, fwhm=20.0, shape="lorentzian", grid=GRID):
+    # Broaden every (frequencies, intensities) pair of `spectra` into one row
+    # of an L2-normalised float32 matrix saved as .npy at `path`, and return it
+    # memory-mapped. Rows are written one molecule at a time, so building the
+    # index never holds more than one broadening kernel in memory.
+    spectra = list(spectra)
+    # A temporary "<name>.<random>.tmp" of our own, so concurrent builds never
+    # share a file; a failed build removes it, and one left by a killed build
+    # is an orphan for prune_temporaries.
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=os.path.dirname(path) or ".")
+    os.close(fd)
+    try:
+        matrix = np.lib.format.open_memmap(tmp, mode="w+", dtype=np.float32, shape=(len(spectra), len(grid)))
+        for row, (freqs, intensities) in enumerate(spectra):
+            matrix[row] = normalize_rows(broaden(freqs, intensities, fwhm, shape, grid=grid))
+        matrix.flush()
+        del matrix
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+    return load_spectrum_index(path)
+
+
+def prune_temporaries(directory, max_age=TMP_MAX_AGE):
+    # Removes *.tmp files in `directory` last written more than `max_age`
+    # seconds ago: builds that were killed before renaming them into place.
+    # Returns the removed names.
+    removed = []
+    now = time.time()
+    for entry in os.listdir(directory):
+        path = os.path.join(directory, entry)
+        if not entry.endswith(".tmp") or not os.path.isfile(path):
+            continue
+        try:
+            if now - os.path.getmtime(path) > max_age:
+                os.remove(path)
+                removed.append(entry)
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+def load_spectrum_index(path):
+    return np.load(path, mmap_mode="r")
+
+
+def top_matches(index, query, n, exclude=None):
+    # Cosine similarity of `query` against every row: one matrix-vector product
+    # and an argpartition. Returns (row indices, scores), best first.
+    query = normalize_rows(np.asarray(query, dtype=np.float32))
+    scores = np.asarray(index @ query)
+    if exclude is not None:
+        scores[exclude] = -np.inf
+    n = min(n, len(scores) - (exclude is not None))
+    if n <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    best = np.argpartition(-scores, n - 1)[:n]
+    best = best[np.argsort(-scores[best])]
+    return best, scores[best]
+
+
+def read_experimental_spectrum(file, grid=GRID):
+    # Two-column text/CSV (wavenumber, absorbance) interpolated onto `grid`;
+    # header or comment lines that do not parse as numbers are skipped.
+    table = pd.read_csv(file, sep=None, engine="python", header=None, comment="#")
+    table = table.iloc[:, :2].apply(pd.to_numeric, errors="coerce").dropna()
+    if table.empty:
+        raise ValueError("no numeric (wavenumber, intensity) rows found")
+    table = table.sort_values(table.columns[0])
+    return np.interp(grid, table.iloc[:, 0], table.iloc[:, 1], left=0.0, right=0.0)
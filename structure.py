@@ -0,0 +1,25 @@
+# structure.py
+# Parser turning the xtbopt XYZ artifact into NumPy arrays, so views build
+# their payloads from arrays instead of re-splitting the file text. The PDB is
+# passed to the viewers as is: 3Dmol reads its bonds (and bond orders) itself.
+
+import numpy as np
+
+
+def _lines(text):
+    if isinstance(text, (bytes, bytearray)):
+        text = text.decode("utf-8")
+    return text.splitlines()
+
+
+def parse_xyz(xyz):
+    # Returns the comment line, elements (N,) and coords (N, 3).
+    lines = _lines(xyz)
+    natoms = int(lines[0].split()[0])
+    rows = [line.split() for line in lines[2:2 + natoms]]
+    return {
+        "comment": lines[1] if len(lines) > 1 else "",
+        "elements": np.array([row[0] for row in rows]),
+        "coords": np.array([row[1:4] for row in rows], dtype=np.float64).reshape(-1, 3),
+    }
+
@@ -0,0 +1,210 @@
+# surfaces.py
+# Molecular surfaces (VDW, SAS, SES) meshed on the server from the ESP cube,
+# with the potential sampled at every vertex, so the browser only colours a
+# ready-made mesh instead of computing the surface and mapping the cube itself.
+
+import json
+from itertools import permutations
+
+import numpy as np
+from rdkit import Chem
+
+from figures import round_significant
+
+BOHR = 0.529177210903  # Å
+PROBE_RADIUS = 1.4     # Å, water
+GRID_SPACING = 0.4     # Å
+
+# Surface type -> field meshed at 0. The viewer's "MS" (molecular surface) is
+# the solvent-excluded surface as well, so meshes are keyed on the field.
+SURFACE_FIELDS = {"VDW": "vdw", "SAS": "sas", "SES": "ses", "MS": "ses"}
+
+_PERIODIC_TABLE = Chem.GetPeriodicTable()
+
+# Cube corners by bit (x, y, z) and the six tetrahedra sharing the 0-7 diagonal.
+_CORNERS = np.array([[c & 1, (c >> 1) & 1, (c >> 2) & 1] for c in range(8)])
+_TETS = [(0, 1 << a, (1 << a) | (1 << b), 7) for a, b in permutations(range(3), 2)]
+
+
+def _case_triangles(mask):
+    # Triangles of one tetrahedron whose vertices k with bit k of `mask` set
+    # are inside, as triples of (vertex, vertex) edges.
+    inside = [k for k in range(4) if mask >> k & 1]
+    outside = [k for k in range(4) if not mask >> k & 1]
+    if len(inside) in (1, 3):
+        lone = inside[0] if len(inside) == 1 else outside[0]
+        return [[(lone, k) for k in range(4) if k != lone]]
+    if len(inside) == 2:
+        (a, b), (c, d) = inside, outside
+        return [[(a, c), (a, d), (b, d)], [(a, c), (b, d), (b, c)]]
+    return []
+
+
+_CASES = [_case_triangles(mask) for mask in range(16)]
+
+
+def parse_cube(cube):
+    # Gaussian cube file -> origin (3,), axes (3, 3) step vectors as rows,
+    # atomic numbers (N,), atom coords (N, 3) and values (nx, ny, nz), all
+    # lengths in Å.
+    if isinstance(cube, (bytes, bytearray)):
+        cube = cube.decode("utf-8")
+    lines = cube.splitlines()
+    header = lines[2].split()
+    natoms = int(header[0])
+    origin = np.array(header[1:4], dtype=np.float64)
+    counts, axes = [], []
+    for line in lines[3:6]:
+        fields = line.split()
+        counts.append(int(fields[0]))
+        axes.append([float(x) for x in fields[1:4]])
+    # Positive counts mean Bohr, negative counts Å.
+    scale = BOHR if counts[0] > 0 else 1.0
+    atoms = np.array([line.split()[:5] for line in lines[6:6 + abs(natoms)]], dtype=np.float64).reshape(-1, 5)
+    # A negative atom count is followed by a line of orbital ids.
+    start = 6 + abs(natoms) + (natoms < 0)
+    shape = tuple(abs(n) for n in counts)
+    values = np.fromstring(" ".join(lines[start:]), sep=" ")
+    if values.size < np.prod(shape):
+        raise ValueError(f"cube holds {values.size} values, expected {np.prod(shape)}")
+    return {
+        "origin": origin * scale,
+        "axes": np.array(axes) * scale,
+        "numbers": atoms[:, 0].astype(np.int64),
+        "coords": atoms[:, 2:5] * scale,
+        "values": values[:np.prod(shape)].reshape(shape),
+    }
+
+
+def sample_cube(cube, points):
+    # Trilinear interpolation of the cube values at `points` (M, 3) [Å].
+    values = cube["values"]
+    upper = np.array(values.shape) - 1
+    frac = (points - cube["origin"]) @ np.linalg.inv(cube["axes"])
+    frac = np.clip(frac, 0, upper - 1e-9)
+    i0 = np.minimum(np.floor(frac).astype(np.int64), np.maximum(upper - 1, 0))
+    w = frac - i0
+    i1 = np.minimum(i0 + 1, upper)
+    out = np.zeros(len(points))
+    for corner in _CORNERS:
+        index = np.where(corner, i1, i0)
+        weight = np.prod(np.where(corner, w, 1 - w), axis=1)
+        out += weight * values[index[:, 0], index[:, 1], index[:, 2]]
+    return out
+
+
+def _sphere_field(points, coords, radii):
+    # min_i(|p - c_i| - r_i) at every point, and the index i attaining it.
+    field = np.full(len(points), np.inf)
+    nearest = np.zeros(len(points), dtype=np.int64)
+    for i, (center, radius) in enumerate(zip(coords, radii)):
+        distance = np.linalg.norm(points - center, axis=1) - radius
+        closer = distance < field
+        field[closer] = distance[closer]
+        nearest[closer] = i
+    return field, nearest
+
+
+def _min_distance(points, targets, chunk=2048):
+    # Distance from each point to the closest target, chunked to bound memory.
+    out = np.empty(len(points))
+    targets = targets.astype(np.float32)
+    target_sq = (targets ** 2).sum(axis=1)
+    for start in range(0, len(points), chunk):
+        block = points[start:start + chunk].astype(np.float32)
+        sq = (block ** 2).sum(axis=1)[:, None] + target_sq[None, :] - 2.0 * block @ targets.T
+        out[start:start + chunk] = np.sqrt(np.maximum(sq.min(axis=1), 0.0))
+    return out
+
+
+def surface_field(coords, radii, kind, spacing=GRID_SPACING, probe=PROBE_RADIUS):
+    # Scalar field on a regular grid around the atoms that is negative inside
+    # the surface and zero on it. Returns (field, origin).
+    pad = radii.max() + probe + 2 * spacing
+    origin = coords.min(axis=0) - pad
+    shape = np.ceil((coords.max(axis=0) + pad - origin) / spacing).astype(np.int64) + 1
+    axes = [origin[k] + spacing * np.arange(shape[k]) for k in range(3)]
+    points = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, 3)
+    if kind == "vdw":
+        field, _ = _sphere_field(points, coords, radii)
+    elif kind == "sas":
+        field, _ = _sphere_field(points, coords, radii + probe)
+    elif kind == "ses":
+        # Outside the SES means within `probe` of a probe centre, i.e. of a point
+        # on or outside the SAS. Probe centres are the grid points just outside
+        # the SAS, projected onto the sphere of their nearest atom.
+        sas, nearest = _sphere_field(points, coords, radii + probe)
+        shell = (sas >= 0) & (sas < spacing * np.sqrt(3))
+        direction = points[shell] - coords[nearest[shell]]
+        direction /= np.linalg.norm(direction, axis=1, keepdims=True)
+        centers = coords[nearest[shell]] + direction * (radii + probe)[nearest[shell], None]
+        field = probe + sas
+        near = (sas < 0) & (sas > -probe - spacing)
+        field[near] = probe - _min_distance(points[near], centers)
+        field[sas >= 0] = probe
+    else:
+        raise ValueError(f"unknown surface field {kind!r}")
+    return field.reshape(tuple(shape)), origin
+
+
+def marching_tetrahedra(field, origin, spacing):
+    # Triangle mesh of the zero level set of `field` on a regular grid: each
+    # cube is split into six tetrahedra, so there are no ambiguous cases.
+    # Vertices on the same grid edge are shared. Returns vertices (V, 3),
+    # unit normals (V, 3) along the field gradient and faces (F, 3) wound
+    # counter-clockwise seen from outside.
+    flat = field.ravel()
+    inside = flat < 0
+    nx, ny, nz = field.shape
+    base = np.arange(flat.size).reshape(field.shape)[:-1, :-1, :-1].ravel()
+    corners = base[:, None] + (_CORNERS @ np.array([ny * nz, nz, 1]))[None, :]
+    crossing = inside[corners]
+    corners = corners[crossing.any(axis=1) & ~crossing.all(axis=1)]
+
+    triangles = []
+    for tet in _TETS:
+        vertices = corners[:, tet]
+        mask = inside[vertices] @ (1 << np.arange(4))
+        for case in range(1, 15):
+            selected = vertices[mask == case]
+            for triangle in _CASES[case]:
+                triangles.append(np.stack([selected[:, [a, b]] for a, b in triangle], axis=1))
+    if not triangles:
+        return np.empty((0, 3)), np.empty((0, 3)), np.empty((0, 3), dtype=np.int64)
+    edges = np.sort(np.concatenate(triangles), axis=-1)  # (F, 3, 2) grid point pairs
+    keys, faces = np.unique(edges[..., 0] * flat.size + edges[..., 1], return_inverse=True)
+    faces = faces.reshape(-1, 3)
+    i, j = np.divmod(keys, flat.size)
+    t = (flat[i] / (flat[i] - flat[j]))[:, None]
+    position = lambda k: origin + spacing * np.stack(np.unravel_index(k, field.shape), axis=-1)
+    vertices = position(i) + t * (position(j) - position(i))
+
+    gradient = np.stack(np.gradient(field), axis=-1).reshape(-1, 3)
+    normals = gradient[i] + t * (gradient[j] - gradient[i])
+    normals /= np.maximum(np.linalg.norm(normals, axis=1, keepdims=True), 1e-12)
+
+    a, b, c = (vertices[faces[:, k]] for k in range(3))
+    flip = (np.cross(b - a, c - a) * normals[faces].sum(axis=1)).sum(axis=1) < 0
+    faces[flip] = faces[flip][:, [0, 2, 1]]
+    return vertices, normals, faces
+
+
+def esp_surface(cube, kind, spacing=GRID_SPACING, probe=PROBE_RADIUS):
+    # Mesh of the `kind` surface ("vdw", "sas" or "ses"; see SURFACE_FIELDS for
+    # the viewer's surface types) around the atoms of the parsed ESP cube, with
+    # the potential at every vertex.
+    radii = np.array([_PERIODIC_TABLE.GetRvdw(int(z)) for z in cube["numbers"]])
+    field, origin = surface_field(cube["coords"], radii, kind, spacing, probe)
+    vertices, normals, faces = marching_tetrahedra(field, origin, spacing)
+    return {"vertices": vertices, "normals": normals, "faces": faces, "values": sample_cube(cube, vertices)}
+
+
+def mesh_payload(mesh, decimals=3):
+    # JSON for the viewer's "mesh" scene part: flat vertex/normal/face arrays
+    # and one potential value per vertex.
+    return json.dumps({
+        "vertices": np.round(mesh["vertices"], decimals).ravel().tolist(),
+        "normals": np.round(mesh["normals"], 2).ravel().tolist(),
+        "faces": mesh["faces"].ravel().tolist(),
+        "values": round_significant(mesh["values"], 4).tolist(),
+    }, separators=(",", ":"))
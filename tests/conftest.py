@@ -0,0 +1,7 @@
+# conftest.py
+# The app's modules live at the repository root, next to streamlit_app.py.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -0,0 +1,93 @@
+# test_atomic.py
+
+import numpy as np
+import pytest
+
+from atomic import aggregate_columns, atom_aggregates, atom_table, environment_classes
+from ragged import TENSOR_SCHEMA, Ragged
+
+
+def make_store(molecules):
+    # Ragged store from one {key: list} dict per molecule; keys left out are missing.
+    return {
+        key: Ragged.from_arrays(
+            [np.asarray(m[key], dtype=dtype) if key in m else None for m in molecules], dtype, ndim)
+        for key, (dtype, ndim) in TENSOR_SCHEMA.items()
+    }
+
+
+def test_aggregates_skip_empty_molecules():
+    store = make_store([
+        {"[atoms]": ["C", "F", "F"], "[fp]": [0.1, 0.5, 0.3]},
+        {},
+        {"[atoms]": ["O", "C"], "[fp]": [0.7, -0.2]},
+    ])
+    frame = atom_aggregates(store)
+    assert list(frame.columns) == aggregate_columns()
+    assert frame["Max f(+)"].tolist()[0::2] == [0.5, 0.7]
+    assert frame["Min f(+)"].tolist()[0::2] == [0.1, -0.2]
+    assert frame["Argmax f(+)"].tolist()[0::2] == [2, 1]
+    assert frame.iloc[1].isna().all()
+    assert frame["Max f(+) on F"].iloc[0] == 0.5
+    assert frame["Min f(+) on F"].iloc[0] == 0.3
+    assert np.isnan(frame["Max f(+) on F"].iloc[2])
+    assert frame["Max f(+) on C"].iloc[2] == -0.2
+
+
+def test_aggregates_of_trailing_empty_molecule():
+    store = make_store([{"[atoms]": ["C"], "[fp]": [0.4]}, {}])
+    frame = atom_aggregates(store)
+    assert frame["Max f(+)"].iloc[0] == 0.4
+    assert np.isnan(frame["Max f(+)"].iloc[1])
+
+
+def test_argmax_takes_first_of_ties():
+    store = make_store([{"[atoms]": ["C", "C", "C"], "Partial Charge [e]": [0.1, 0.3, 0.3]}])
+    assert atom_aggregates(store)["Argmax Partial Charge"].iloc[0] == 2
+
+
+def test_mismatched_atom_count_drops_element_columns():
+    store = make_store([
+        {"[atoms]": ["C", "F"], "[fm]": [0.2, 0.4, 0.6]},
+        {"[atoms]": ["F"], "[fm]": [0.9]},
+    ])
+    frame = atom_aggregates(store)
+    # Whole-molecule values do not need the element list...
+    assert frame["Max f(-)"].tolist() == [0.6, 0.9]
+    # ...but per-element ones cannot be assigned when the lengths differ.
+    assert np.isnan(frame["Max f(-) on F"].iloc[0])
+    assert frame["Max f(-) on F"].iloc[1] == 0.9
+
+
+def test_atom_table_aligns_only_matching_properties():
+    store = make_store([
+        {"[atoms]": ["C", "F"], "[fp]": [0.1, 0.2], "Partial Charge [e]": [0.5]},
+        {},
+        {"[atoms]": ["O"], "[fp]": [0.3]},
+    ])
+    table = atom_table(store, ["FC", "", "O"])
+    assert table["Molecule"].tolist() == [0, 0, 2]
+    assert table["Atom"].tolist() == [1, 2, 1]
+    assert table["f(+)"].tolist() == [0.1, 0.2, 0.3]
+    assert table["Partial Charge"].isna().all()
+    # "FC" lists F before C, so its environments do not line up with the atoms.
+    assert table["Environment"].tolist()[:2] == ["unassigned", "unassigned"]
+
+
+def test_environment_classes():
+    # Trifluoroacetic acid: O=C(O)C(F)(F)F with explicit hydrogens.
+    classes = environment_classes("O=C(O)C(F)(F)F", ["O", "C", "O", "C", "F", "F", "F", "H"])
+    assert classes.tolist() == [
+        "O (headgroup)", "C (headgroup)", "O (headgroup)",
+        "C (CF3)", "F (CF3)", "F (CF3)", "F (CF3)", "H (other)",
+    ]
+
+
+@pytest.mark.parametrize("smiles, elements", [
+    ("O=C(O)C(F)(F)F", ["O", "C", "O", "C", "F", "F", "F"]),  # hydrogen missing
+    ("O=C(O)C(F)(F)F", ["C", "O", "O", "C", "F", "F", "F", "H"]),  # order differs
+    ("not a smiles", ["C"]),
+    ("C", None),
+])
+def test_environment_classes_mismatch(smiles, elements):
+    assert environment_classes(smiles, elements) is None
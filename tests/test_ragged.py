@@ -0,0 +1,93 @@
+# test_ragged.py
+
+import os
+
+import numpy as np
+
+from ragged import TENSOR_SCHEMA, Ragged, build_tensor_store, load_tensor_store, molecule_tensors, save_tensor_store
+
+
+def test_from_arrays_empty_and_missing_molecules():
+    ragged = Ragged.from_arrays([np.arange(3.0), None, np.empty(0), np.arange(2.0)], np.float64, 1)
+    assert len(ragged) == 4
+    assert ragged.lengths.tolist() == [3, 0, 0, 2]
+    assert ragged.starts.tolist() == [0, 3, 3, 3]
+    assert ragged[0].tolist() == [0.0, 1.0, 2.0]
+    assert ragged[1].size == 0 and ragged[2].size == 0
+    assert ragged[3].tolist() == [0.0, 1.0]
+
+
+def test_from_arrays_all_missing():
+    ragged = Ragged.from_arrays([None, None], np.float32, 2)
+    assert ragged.values.size == 0
+    assert ragged.values.dtype == np.float32
+    assert ragged[1].shape == (0, 0)
+
+
+def test_two_dimensional_rows_keep_their_shape():
+    a = np.arange(6, dtype=np.float32).reshape(2, 3)
+    b = np.arange(4, dtype=np.float32).reshape(1, 4)
+    ragged = Ragged.from_arrays([a, None, b], np.float32, 2)
+    np.testing.assert_array_equal(ragged[0], a)
+    np.testing.assert_array_equal(ragged[2], b)
+    assert ragged.lengths.tolist() == [6, 0, 4]
+
+
+def test_save_load_round_trip(tmp_path):
+    store = {
+        "[atoms]": Ragged.from_arrays([np.array(["C", "F"]), None, np.array(["O"])], str, 1),
+        "dx [Å]": Ragged.from_arrays([np.ones((2, 2)), None, np.zeros((1, 1))], np.float32, 2),
+    }
+    path = str(tmp_path / "tensors_v1")
+    save_tensor_store(path, store)
+    loaded = load_tensor_store(path)
+    assert set(loaded) == set(store)
+    for key, ragged in store.items():
+        assert isinstance(loaded[key].values, np.memmap)
+        for i in range(len(ragged)):
+            np.testing.assert_array_equal(loaded[key][i], ragged[i])
+    assert molecule_tensors(loaded, 1) == {}
+    assert molecule_tensors(loaded, 2)["[atoms]"].tolist() == ["O"]
+
+
+def test_save_over_existing_store_keeps_it(tmp_path):
+    path = str(tmp_path / "tensors_v1")
+    first = {"[fp]": Ragged.from_arrays([np.arange(2.0)], np.float64, 1)}
+    save_tensor_store(path, first)
+    save_tensor_store(path, {"[fp]": Ragged.from_arrays([np.arange(5.0)], np.float64, 1)})
+    assert load_tensor_store(path)["[fp]"][0].tolist() == [0.0, 1.0]
+    assert os.listdir(tmp_path) == ["tensors_v1"]
+
+
+def test_build_skips_malformed_and_empty_entries(tmp_path):
+    tensor_props = [
+        (1, {"[atoms]": ["C1", "F2"], "[fp]": [0.1, 0.2], "dx [Å]": [[0.0, 0.1], [0.2, 0.3]]}),
+        (0, {"[atoms]": [], "[fp]": [[1.0]], "Partial Charge [e]": ["x"]}),
+    ]
+    store = build_tensor_store(str(tmp_path / "tensors_v1"), tensor_props, 3)
+    assert set(store) == set(TENSOR_SCHEMA)
+    assert molecule_tensors(store, 0) == {}
+    assert molecule_tensors(store, 2) == {}
+    tensors = molecule_tensors(store, 1)
+    assert tensors["[atoms]"].tolist() == ["C", "F"]
+    assert tensors["dx [Å]"].shape == (2, 2)
+
+
+def test_build_molecule_without_frequencies(tmp_path):
+    # A molecule whose frequency and intensity lists are empty has no IR keys,
+    # which the IR panel and comparison treat as "no spectrum"; its rows in
+    # the columns the IR index reads are zero-length.
+    tensor_props = [
+        (0, {"Frequency [cm⁻¹]": [], "IR Itensity [kmmol⁻¹]": [], "[fp]": [0.5]}),
+        (1, {"Frequency [cm⁻¹]": [100.0, 200.0], "IR Itensity [kmmol⁻¹]": [1.0, 2.0]}),
+    ]
+    store = build_tensor_store(str(tmp_path / "tensors_v1"), tensor_props, 2)
+    tensors = molecule_tensors(store, 0)
+    assert "Frequency [cm⁻¹]" not in tensors
+    assert "IR Itensity [kmmol⁻¹]" not in tensors
+    assert tensors["[fp]"].tolist() == [0.5]
+    assert store["Frequency [cm⁻¹]"][0].shape == (0,)
+    assert store["IR Itensity [kmmol⁻¹]"][0].shape == (0,)
+    tensors = molecule_tensors(store, 1)
+    assert tensors["Frequency [cm⁻¹]"].tolist() == [100.0, 200.0]
+    assert tensors["IR Itensity [kmmol⁻¹]"].tolist() == [1.0, 2.0]
@@ -0,0 +1,105 @@
+# test_spectra.py
+
+import os
+import time
+
+import numpy as np
+import pytest
+
+from spectra import GRID, LINE_SHAPES, broaden, build_spectrum_index, normalize_rows, prune_temporaries, top_matches
+
+STEP = GRID[1] - GRID[0]
+
+
+@pytest.mark.parametrize("shape, tolerance", [("lorentzian", 5e-3), ("gaussian", 1e-9)])
+def test_peak_keeps_its_integrated_intensity(shape, tolerance):
+    # Lorentzian tails beyond the grid hold about 0.3% of the band.
+    spectrum = broaden([2000.0], [3.0], fwhm=20.0, shape=shape)
+    assert spectrum.sum() * STEP == pytest.approx(3.0, rel=tolerance)
+    assert GRID[np.argmax(spectrum)] == 2000.0
+
+
+@pytest.mark.parametrize("shape", LINE_SHAPES)
+def test_peak_has_the_requested_width(shape):
+    spectrum = broaden([2000.0], [1.0], fwhm=20.0, shape=shape)
+    peak = spectrum[GRID == 2000.0][0]
+    assert spectrum[GRID == 2010.0][0] == pytest.approx(peak / 2)
+    assert spectrum[GRID == 1990.0][0] == pytest.approx(peak / 2)
+
+
+def test_broaden_scales_and_drops_imaginary_modes():
+    spectrum = broaden([-500.0, 1000.0], [5.0, 1.0], scale=2.0)
+    assert GRID[np.argmax(spectrum)] == 2000.0
+    np.testing.assert_allclose(spectrum, broaden([2000.0], [1.0]))
+
+
+def test_broaden_without_modes_is_zero():
+    spectrum = broaden([], [])
+    assert spectrum.shape == GRID.shape
+    assert not spectrum.any()
+
+
+def test_unknown_line_shape():
+    with pytest.raises(ValueError):
+        broaden([1000.0], [1.0], shape="voigt")
+
+
+def test_top_matches_ranks_by_cosine_and_excludes_query():
+    rng = np.random.default_rng(0)
+    rows = rng.random((6, 8)).astype(np.float32)
+    index = normalize_rows(rows)
+    query = rows[2] * 5.0
+    best, scores = top_matches(index, query, 3, exclude=2)
+    assert 2 not in best
+    cosine = rows @ query / (np.linalg.norm(rows, axis=1) * np.linalg.norm(query))
+    cosine[2] = -np.inf
+    np.testing.assert_array_equal(best, np.argsort(-cosine)[:3])
+    np.testing.assert_allclose(scores, cosine[best], rtol=1e-5)
+    assert list(scores) == sorted(scores, reverse=True)
+
+
+def test_top_matches_never_returns_more_than_the_other_rows():
+    index = normalize_rows(np.eye(3, dtype=np.float32))
+    best, scores = top_matches(index, [1.0, 0.0, 0.0], 10, exclude=0)
+    assert sorted(best.tolist()) == [1, 2]
+    assert scores.tolist() == [0.0, 0.0]
+    best, _ = top_matches(index[:1], [1.0, 0.0, 0.0], 5, exclude=0)
+    assert best.size == 0
+
+
+def test_build_index_rows_are_normalised(tmp_path):
+    path = str(tmp_path / "ir.npy")
+    index = build_spectrum_index(path, [([1000.0, 1500.0], [1.0, 2.0]), ([], [])])
+    assert index.shape == (2, len(GRID))
+    assert index.dtype == np.float32
+    assert np.linalg.norm(index[0]) == pytest.approx(1.0, rel=1e-5)
+    assert not np.asarray(index[1]).any()
+    assert os.listdir(tmp_path) == ["ir.npy"]
+
+
+def test_failed_build_leaves_no_file(tmp_path):
+    path = str(tmp_path / "ir.npy")
+    with pytest.raises(ValueError):
+        build_spectrum_index(path, [([1000.0], [1.0])], shape="voigt")
+    assert os.listdir(tmp_path) == []
+
+
+def test_failed_rebuild_keeps_the_existing_index(tmp_path):
+    path = str(tmp_path / "ir.npy")
+    first = np.array(build_spectrum_index(path, [([1000.0], [1.0])]))
+    with pytest.raises(ValueError):
+        build_spectrum_index(path, [([1000.0], [1.0]), ([2000.0], [1.0])], shape="voigt")
+    assert os.listdir(tmp_path) == ["ir.npy"]
+    np.testing.assert_array_equal(np.load(path), first)
+
+
+def test_prune_temporaries_removes_only_old_ones(tmp_path):
+    old, fresh, index = tmp_path / "ir.npy.a.tmp", tmp_path / "ir.npy.b.tmp", tmp_path / "ir.npy"
+    for path in (old, fresh, index):
+        path.write_bytes(b"")
+    os.mkdir(tmp_path / "tensors_v1.c.tmp")
+    hour_ago = time.time() - 7200
+    os.utime(old, (hour_ago, hour_ago))
+    os.utime(index, (hour_ago, hour_ago))
+    assert prune_temporaries(str(tmp_path)) == ["ir.npy.a.tmp"]
+    assert sorted(os.listdir(tmp_path)) == ["ir.npy", "ir.npy.b.tmp", "tensors_v1.c.tmp"]
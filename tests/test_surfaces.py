@@ -0,0 +1,104 @@
+# test_surfaces.py
+
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from surfaces import esp_surface, marching_tetrahedra, parse_cube
+
+
+def sphere_field(radius, spacing, center):
+    # Signed distance to a sphere on a grid from the origin, and the grid origin.
+    n = int(np.ceil(2 * (radius + 2 * spacing) / spacing)) + 1
+    origin = np.full(3, -(radius + 2 * spacing))
+    axes = [origin[k] + spacing * np.arange(n) for k in range(3)]
+    points = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1)
+    return np.linalg.norm(points - center, axis=-1) - radius, origin
+
+
+def assert_closed_and_outward(vertices, faces):
+    # Every directed edge appears exactly once and its reverse too, so each
+    # edge joins two faces wound the same way; the signed volume is positive.
+    directed = Counter((a, b) for face in faces.tolist() for a, b in zip(face, face[1:] + face[:1]))
+    assert max(directed.values()) == 1
+    assert all((b, a) in directed for a, b in directed)
+    a, b, c = (vertices[faces[:, k]] for k in range(3))
+    volume = np.einsum("ij,ij->i", a, np.cross(b, c)).sum() / 6
+    assert volume > 0
+    return volume
+
+
+def test_sphere_mesh_is_closed_and_wound_outwards():
+    radius, spacing, center = 2.0, 0.25, np.array([0.03, -0.02, 0.01])
+    field, origin = sphere_field(radius, spacing, center)
+    vertices, normals, faces = marching_tetrahedra(field, origin, spacing)
+    assert len(faces) > 0 and faces.dtype.kind == "i"
+    volume = assert_closed_and_outward(vertices, faces)
+    assert volume == pytest.approx(4 / 3 * np.pi * radius ** 3, rel=0.02)
+    np.testing.assert_allclose(np.linalg.norm(vertices - center, axis=1), radius, atol=0.02)
+    np.testing.assert_allclose(np.linalg.norm(normals, axis=1), 1.0)
+    outward = (vertices - center) / radius
+    assert (np.einsum("ij,ij->i", normals, outward) > 0.99).all()
+    a, b, c = (vertices[faces[:, k]] for k in range(3))
+    centroids = (a + b + c) / 3
+    assert (np.einsum("ij,ij->i", np.cross(b - a, c - a), centroids - center) > 0).all()
+
+
+def test_no_crossing_gives_an_empty_mesh():
+    vertices, normals, faces = marching_tetrahedra(np.ones((3, 3, 3)), np.zeros(3), 1.0)
+    assert vertices.shape == (0, 3) and normals.shape == (0, 3) and faces.shape == (0, 3)
+
+
+def two_atom_cube(spacing=0.5, n=25):
+    # Cube of the linear potential 0.1 x - 0.2 y + 0.05 z around an HF-like
+    # pair of atoms, as parse_cube returns it.
+    origin = np.full(3, -(n - 1) * spacing / 2)
+    axes = [origin[k] + spacing * np.arange(n) for k in range(3)]
+    points = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1)
+    return {
+        "origin": origin,
+        "axes": np.eye(3) * spacing,
+        "numbers": np.array([9, 1]),
+        "coords": np.array([[0.0, 0.0, 0.0], [0.92, 0.0, 0.0]]),
+        "values": points @ np.array([0.1, -0.2, 0.05]),
+    }
+
+
+@pytest.mark.parametrize("kind", ["vdw", "sas", "ses"])
+def test_esp_surface_is_closed_with_sampled_values(kind):
+    cube = two_atom_cube()
+    mesh = esp_surface(cube, kind)
+    assert_closed_and_outward(mesh["vertices"], mesh["faces"])
+    values = mesh["values"]
+    assert len(values) == len(mesh["vertices"])
+    assert cube["values"].min() <= values.min() and values.max() <= cube["values"].max()
+    # Trilinear sampling reproduces a linear potential exactly.
+    np.testing.assert_allclose(values, mesh["vertices"] @ np.array([0.1, -0.2, 0.05]), atol=1e-9)
+
+
+def test_surfaces_nest():
+    # VDW inside SES inside SAS.
+    cube = two_atom_cube()
+    radius = {kind: np.linalg.norm(esp_surface(cube, kind)["vertices"] - [0.46, 0, 0], axis=1).max()
+              for kind in ("vdw", "ses", "sas")}
+    assert radius["vdw"] <= radius["ses"] + 0.1 < radius["sas"]
+
+
+def test_parse_cube_units_and_values():
+    cube = "\n".join([
+        "comment", "comment",
+        "    1    0.000000    0.000000    0.000000",
+        "    2    1.000000    0.000000    0.000000",
+        "    2    0.000000    1.000000    0.000000",
+        "    2    0.000000    0.000000    1.000000",
+        "    9    0.000000    0.000000    0.000000    0.000000",
+        " 1.0 2.0 3.0 4.0 5.0 6.0", " 7.0 8.0",
+    ])
+    parsed = parse_cube(cube.encode())
+    np.testing.assert_allclose(parsed["axes"], np.eye(3) * 0.529177210903)
+    assert parsed["numbers"].tolist() == [9]
+    assert parsed["values"].shape == (2, 2, 2)
+    assert parsed["values"][1, 1, 1] == 8.0
+    with pytest.raises(ValueError):
+        parse_cube(cube.rsplit("\n", 1)[0])
@@ -0,0 +1,52 @@
+# test_vibrations.py
+
+import json
+
+import numpy as np
+import pytest
+
+from vibrations import local_mode_table, mode_payload
+
+
+def test_local_mode_table_row_order_and_contributions():
+    # Two normal modes x three local modes: rows run over the local modes of
+    # each normal mode in turn, matching the contributions matrix row-major.
+    tensor_props = {
+        "Frequency [cm⁻¹]": [500.0, 1200.0],
+        "local [modes]": ["C-F str", "C-C str", "CF2 bend"],
+        "local [contributions]": [[10.0, 30.0, 60.0], [70.0, 20.0, 10.0]],
+    }
+    table = local_mode_table(tensor_props)
+    assert list(table.columns) == ["Normal Mode", "Local Mode", "Contribution"]
+    assert table["Normal Mode"].tolist() == [500.0, 500.0, 500.0, 1200.0, 1200.0, 1200.0]
+    assert table["Local Mode"].tolist() == ["C-F str", "C-C str", "CF2 bend"] * 2
+    assert table["Contribution"].tolist() == [10.0, 30.0, 60.0, 70.0, 20.0, 10.0]
+    assert table["Local Mode"].dtype == object
+    for (freq, mode), contribution in table.set_index(["Normal Mode", "Local Mode"])["Contribution"].items():
+        i = tensor_props["Frequency [cm⁻¹]"].index(freq)
+        j = tensor_props["local [modes]"].index(mode)
+        assert contribution == tensor_props["local [contributions]"][i][j]
+
+
+def test_local_mode_table_rejects_mismatched_matrix():
+    tensor_props = {
+        "Frequency [cm⁻¹]": [500.0, 1200.0],
+        "local [modes]": ["a", "b", "c"],
+        "local [contributions]": [[1.0, 2.0], [3.0, 4.0]],
+    }
+    with pytest.raises(ValueError):
+        local_mode_table(tensor_props)
+
+
+def test_mode_payload_matches_geometry():
+    xyz = {"elements": np.array(["C", "F"]), "coords": np.array([[0.0, 0.0, 0.0], [1.35, 0.0, 0.0]])}
+    tensor_props = {
+        "Frequency [cm⁻¹]": [1100.123],
+        "dx [Å]": [[0.1, -0.1]], "dy [Å]": [[0.0, 0.0]], "dz [Å]": [[0.0, 0.2]],
+    }
+    payload = json.loads(mode_payload(xyz, tensor_props))
+    assert payload["elements"] == ["C", "F"]
+    assert payload["frequencies"] == [1100.12]
+    assert payload["modes"] == [[0.1, 0.0, 0.0, -0.1, 0.0, 0.2]]
+    with pytest.raises(ValueError):
+        mode_payload({"elements": xyz["elements"][:1], "coords": xyz["coords"][:1]}, tensor_props)
@@ -0,0 +1,44 @@
+# vibrations.py
+# Normal-mode data of a molecule as NumPy arrays, assembled once per molecule.
+
+import json
+
+import numpy as np
+import pandas as pd
+
+
+def displacements(tensor_props):
+    # (modes, atoms, 3) displacement tensor from the per-axis nested lists.
+    return np.stack(
+        [np.asarray(tensor_props[k], dtype=np.float64) for k in ("dx [Å]", "dy [Å]", "dz [Å]")],
+        axis=-1,
+    )
+
+
+def mode_payload(xyz, tensor_props, decimals=4):
+    # JSON for the viewer's "modes" format: the geometry plus every mode's
+    # displacement vectors, so switching modes needs no server round trip.
+    disp = displacements(tensor_props)
+    coords = xyz["coords"]
+    if disp.shape[1:] != coords.shape:
+        raise ValueError(f"displacements {disp.shape} do not match geometry {coords.shape}")
+    return json.dumps({
+        "elements": xyz["elements"].tolist(),
+        "coords": np.round(coords, decimals).ravel().tolist(),
+        "frequencies": np.asarray(tensor_props["Frequency [cm⁻¹]"], dtype=np.float64).round(2).tolist(),
+        "modes": np.round(disp, decimals).reshape(len(disp), -1).tolist(),
+    }, separators=(",", ":"))
+
+
+def local_mode_table(tensor_props):
+    # Long-format (normal mode, local mode, contribution) table, one row per
+    # matrix entry in row-major order, built straight from the contributions matrix.
+    freqs = np.asarray(tensor_props["Frequency [cm⁻¹]"], dtype=np.float64)
+    # Object dtype keeps the local modes categorical for the stacked bar colours.
+    modes = np.asarray(tensor_props["local [modes]"], dtype=object)
+    contributions = np.asarray(tensor_props["local [contributions]"], dtype=np.float64)
+    return pd.DataFrame({
+        "Normal Mode": np.repeat(freqs, len(modes)),
+        "Local Mode": np.tile(modes, len(freqs)),
+        "Contribution": contributions.reshape(len(freqs), len(modes)).ravel(),
+    })
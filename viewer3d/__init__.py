@@ -0,0 +1,94 @@
+# viewer3d
+# A persistent 3Dmol.js viewer component. The iframe stays mounted across reruns
+# (it is keyed), loads 3Dmol once and keeps models and volumes resident, so a
+# rerun only ships the parts of the scene that changed.
+#
+# Large texts (PDB/XYZ models, cube files) are passed as "blobs" keyed by a
+# stable id. A blob is only sent if the browser does not hold it yet; when the
+# iframe is remounted and has lost its blobs it replies with the ids it still
+# holds and the next rerun sends the rest.
+
+import os
+
+import numpy as np
+import streamlit as st
+import streamlit.components.v1 as components
+
+from assets import MissingAssetError, asset_url
+
+_component = components.declare_component(
+    "viewer3d", path=os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend")
+)
+
+# Session state entry tracking which blobs each viewer instance holds.
+_RESIDENT = "_viewer3d_resident"
+
+DEFAULT_STYLE = {
+    "sphere": {"scale": 0.25, "colorscheme": "Jmol"},
+    "stick": {"radius": 0.15, "colorscheme": "Jmol"},
+}
+
+DEFAULT_LABEL_STYLE = {
+    "backgroundColor": "white",
+    "fontColor": "black",
+    "backgroundOpacity": 0.75,
+    "inFront": True,
+}
+
+
+def scene(model, fmt="pdb", height=400, style=None, **parts):
+    # Build a scene spec. `model` is a blob id; other parts (labels, label_style,
+    # colors, hover_labels, properties, isosurfaces, surface, mesh, vibrate,
+    # model_options) are passed through to the frontend. `colors` and
+    # `hover_labels` hold one entry per atom. `properties` maps a name to a dict
+    # of labels/label_style/colors/hover_labels and adds an in-viewer switch
+    # between them.
+    spec = {"model": model, "format": fmt, "height": height, "style": style or DEFAULT_STYLE}
+    spec.update({k: v for k, v in parts.items() if v is not None})
+    return spec
+
+
+def level(label, min_value, max_value, value, step):
+    # In-viewer slider for the isosurface value / surface colour range, passed
+    # as viewer3d(..., level=...). One slider drives all the viewer's scenes:
+    # isosurfaces are drawn at +/- its value and surfaces and meshes are
+    # coloured over -value..value, all without a rerun.
+    return {"label": label, "min": min_value, "max": max_value, "value": value, "step": step}
+
+
+def color_map(values, colors, vmin, vmax):
+    # "#rrggbb" per value, interpolated linearly between the `colors` anchors
+    # spread evenly over vmin..vmax; values outside the range are clipped.
+    values = np.asarray(values, dtype=np.float64)
+    anchors = np.array([[int(c[i:i + 2], 16) for i in (1, 3, 5)] for c in colors], dtype=np.float64)
+    span = vmax - vmin if vmax > vmin else 1.0
+    t = np.clip((values - vmin) / span, 0.0, 1.0) * (len(colors) - 1)
+    positions = np.arange(len(colors))
+    rgb = np.stack([np.interp(t, positions, anchors[:, k]) for k in range(3)], axis=-1)
+    return ["#%02x%02x%02x" % tuple(c) for c in np.rint(rgb).astype(int)]
+
+
+def _text(blob):
+    return blob.decode("utf-8") if isinstance(blob, (bytes, bytearray)) else blob
+
+
+def viewer3d(scenes, blobs, key, urls=None, level=None):
+    # scenes: list of scene specs (see `scene`), stacked vertically with linked cameras.
+    # blobs: dict of blob id -> text/bytes referenced by the scenes.
+    # urls: dict of blob id -> URL (e.g. assets.asset_url) the browser fetches the
+    #   blob from itself, gunzipping *.gz; for static data shared by every session.
+    # level: optional `level` slider shared by all the scenes.
+    try:
+        library = asset_url("3Dmol-min.js")
+    except MissingAssetError as e:
+        st.error(str(e))
+        return
+    resident = st.session_state.setdefault(_RESIDENT, {}).setdefault(key, {"nonce": None, "ids": set()})
+    reply = st.session_state.get(key)
+    if isinstance(reply, dict) and reply.get("nonce") != resident["nonce"]:
+        # The frontend lost some blobs (remount or eviction): trust its own list.
+        resident["nonce"] = reply.get("nonce")
+        resident["ids"] = set(reply.get("resident", ()))
+    delta = {i: _text(b) for i, b in blobs.items() if i not in resident["ids"]}
+    resident["ids"].update(delta)
+    _component(scenes=scenes, blobs=delta, urls=urls or {}, level=level, library=library, key=key, default=None)
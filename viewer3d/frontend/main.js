@@ -0,0 +1,449 @@
+// Frontend of the viewer3d Streamlit component. Speaks the component
+// postMessage protocol directly, so there is no build step.
+(function () {
+    "use strict";
+
+    const MAX_BLOBS = 32;
+    const blobs = new Map();    // blob id -> text, oldest first
+    const volumes = new Map();  // blob id -> $3Dmol.VolumeData
+    const parsed = new Map();   // blob id -> parsed JSON payload
+    const root = document.getElementById("root");
+    let states = [];            // one {viewer, element, spec} per scene
+    let slider = null;          // {element, config, value} of the shared level control
+    let frameHeight = -1;
+    let library = null;         // promise for 3Dmol.js
+
+    function loadLibrary(url) {
+        // Local assets are relative to the app root (this page lives at
+        // component/<name>/index.html) and are served as text/plain, so they
+        // are fetched and injected rather than loaded with <script src>.
+        if (/^https?:/.test(url)) {
+            return new Promise(function (resolve, reject) {
+                const script = document.createElement("script");
+                script.src = url;
+                script.onload = resolve;
+                script.onerror = reject;
+                document.head.appendChild(script);
+            });
+        }
+        return fetch("../../" + url)
+            .then(function (response) { return response.text(); })
+            .then(function (code) {
+                const script = document.createElement("script");
+                script.text = code;
+                document.head.appendChild(script);
+            });
+    }
+
+    // Blobs served as static files. Gzipped ones are inflated in the browser.
+    function fetchBlob(id, url) {
+        return fetch("../../" + url).then(function (response) {
+            if (!response.ok) {
+                throw new Error(url + ": " + response.status);
+            }
+            if (/\.gz(\?|$)/.test(url)) {
+                return new Response(response.body.pipeThrough(new DecompressionStream("gzip"))).text();
+            }
+            return response.text();
+        }).then(function (text) { putBlob(id, text); });
+    }
+
+    function send(type, data) {
+        window.parent.postMessage(Object.assign({isStreamlitMessage: true, type: type}, data), "*");
+    }
+
+    function setFrameHeight(height) {
+        if (height !== frameHeight) {
+            frameHeight = height;
+            send("streamlit:setFrameHeight", {height: height});
+        }
+    }
+
+    function putBlob(id, text) {
+        blobs.delete(id);
+        volumes.delete(id);
+        parsed.delete(id);
+        blobs.set(id, text);
+        while (blobs.size > MAX_BLOBS) {
+            const oldest = blobs.keys().next().value;
+            blobs.delete(oldest);
+            volumes.delete(oldest);
+            parsed.delete(oldest);
+        }
+    }
+
+    function volume(id) {
+        if (!volumes.has(id)) {
+            volumes.set(id, new $3Dmol.VolumeData(blobs.get(id), "cube"));
+        }
+        return volumes.get(id);
+    }
+
+    function json(id) {
+        if (!parsed.has(id)) {
+            parsed.set(id, JSON.parse(blobs.get(id)));
+        }
+        return parsed.get(id);
+    }
+
+    // "modes" models hold the geometry and every normal mode's displacements;
+    // the selected mode is turned into an extended XYZ model for vibrate().
+    function addModeModel(state, spec) {
+        const data = json(spec.model);
+        if (state.modeModel !== spec.model) {
+            state.modeModel = spec.model;
+            state.mode = 0;
+        }
+        const mode = data.modes[state.mode];
+        const lines = [String(data.elements.length), ""];
+        data.elements.forEach(function (element, a) {
+            const i = 3 * a;
+            lines.push([element, data.coords[i], data.coords[i + 1], data.coords[i + 2],
+                mode[i], mode[i + 1], mode[i + 2]].join(" "));
+        });
+        state.viewer.addModel(lines.join("\n"), "xyz", spec.model_options || {});
+        modeControl(state, data);
+    }
+
+    function modeControl(state, data) {
+        if (!state.control) {
+            state.control = document.createElement("select");
+            state.control.className = "mode-control";
+            state.control.addEventListener("change", function () {
+                state.mode = Number(state.control.value);
+                const spec = state.spec;
+                state.spec = null;
+                applyScene(state, spec);
+            });
+            state.element.appendChild(state.control);
+        }
+        state.control.innerHTML = data.frequencies.map(function (freq, i) {
+            return '<option value="' + i + '">' + freq.toFixed(2) + " cm⁻¹</option>";
+        }).join("");
+        state.control.value = String(state.mode);
+    }
+
+    // "properties" parts hold several per-atom layers (e.g. the three Fukui
+    // indices); a <select> in the viewer picks the one shown, client-side.
+    function propertyControl(state, properties) {
+        const names = properties ? Object.keys(properties) : [];
+        if (names.indexOf(state.property) < 0) {
+            state.property = names[0];
+        }
+        if (names.length < 2) {
+            if (state.propertyControl) {
+                state.propertyControl.remove();
+                state.propertyControl = null;
+            }
+            return;
+        }
+        if (!state.propertyControl) {
+            state.propertyControl = document.createElement("select");
+            state.propertyControl.className = "mode-control";
+            state.propertyControl.addEventListener("change", function () {
+                state.property = state.propertyControl.value;
+                drawProperty(state, state.spec);
+                state.viewer.render();
+            });
+            state.element.appendChild(state.propertyControl);
+        }
+        state.propertyControl.innerHTML = names.map(function (name) {
+            return "<option>" + name + "</option>";
+        }).join("");
+        state.propertyControl.value = state.property;
+    }
+
+    // Style, labels and hover labels of the scene or of its active property.
+    // Per-atom colours go into the style as a colorfunc, so the whole molecule
+    // is coloured with one setStyle call.
+    function drawProperty(state, spec) {
+        const v = state.viewer;
+        const active = (spec.properties && spec.properties[state.property]) || spec;
+        const labelStyle = active.label_style || spec.label_style || {};
+        let style = spec.style;
+        if (active.colors) {
+            const colors = active.colors;
+            const colorfunc = function (atom) { return colors[atom.index] || "#808080"; };
+            style = {};
+            Object.keys(spec.style).forEach(function (kind) {
+                style[kind] = Object.assign({}, spec.style[kind], {colorfunc: colorfunc});
+                delete style[kind].colorscheme;
+            });
+        }
+        v.setStyle({}, style);
+        v.removeAllLabels();
+        (active.labels || []).forEach(function (text, index) {
+            if (text !== null) {
+                v.addLabel(String(text), labelStyle, {index: index});
+            }
+        });
+        const hover = active.hover_labels;
+        v.setHoverable({}, Boolean(hover), function (atom, viewer) {
+            if (!atom.hoverLabel && hover[atom.index] !== null && hover[atom.index] !== undefined) {
+                atom.hoverLabel = viewer.addLabel(String(hover[atom.index]), Object.assign({}, labelStyle, {position: atom}));
+            }
+        }, function (atom, viewer) {
+            if (atom.hoverLabel) {
+                viewer.removeLabel(atom.hoverLabel);
+                delete atom.hoverLabel;
+            }
+        });
+    }
+
+    // Isovalue / potential range slider, one per viewer: it sits on the first
+    // scene and drives every (linked) scene. Moving it redraws the surfaces
+    // from the resident volumes without a rerun. Returns whether the control
+    // changed.
+    function levelControl(spec) {
+        const config = JSON.stringify(spec || null);
+        if (slider && slider.config === config) {
+            return false;
+        }
+        if (slider) {
+            slider.element.remove();
+            slider = null;
+        }
+        if (!spec || states.length === 0) {
+            return true;
+        }
+        const element = document.createElement("label");
+        element.className = "level-control";
+        const input = document.createElement("input");
+        input.type = "range";
+        input.min = spec.min;
+        input.max = spec.max;
+        input.step = spec.step;
+        input.value = spec.value;
+        const readout = document.createElement("span");
+        const decimals = (String(spec.step).split(".")[1] || "").length;
+        element.append(spec.label + " ", input, readout);
+        states[0].element.appendChild(element);
+        slider = {element: element, config: config, value: Number(spec.value)};
+        readout.textContent = slider.value.toFixed(decimals);
+        let pending = false;
+        input.addEventListener("input", function () {
+            slider.value = Number(input.value);
+            readout.textContent = slider.value.toFixed(decimals);
+            if (!pending) {
+                pending = true;
+                requestAnimationFrame(function () {
+                    pending = false;
+                    states.forEach(function (state) {
+                        drawShapes(state, state.spec);
+                        recolorSurface(state, state.spec);
+                        state.viewer.render();
+                    });
+                });
+            }
+        });
+        return true;
+    }
+
+    function levelValue() {
+        return slider ? slider.value : null;
+    }
+
+    function drawShapes(state, spec) {
+        // With a level control, isosurfaces sit at +/- its value (by the sign of
+        // isoval) and meshes are coloured over -value..value.
+        const level = levelValue();
+        state.viewer.removeAllShapes();
+        (spec.isosurfaces || []).forEach(function (iso) {
+            state.viewer.addIsosurface(volume(iso.volume), {
+                isoval: level === null ? iso.isoval : Math.sign(iso.isoval) * level,
+                color: iso.color,
+                opacity: iso.opacity,
+            });
+        });
+        if (spec.mesh) {
+            drawMesh(state, spec.mesh, level);
+        }
+    }
+
+    // "mesh" parts are surfaces meshed on the server with one potential value
+    // per vertex; only the vertex colours are computed here.
+    function drawMesh(state, mesh, level) {
+        const data = json(mesh.blob);
+        if (!data.vectors) {
+            const vectors = function (flat) {
+                const out = [];
+                for (let i = 0; i < flat.length; i += 3) {
+                    out.push(new $3Dmol.Vector3(flat[i], flat[i + 1], flat[i + 2]));
+                }
+                return out;
+            };
+            data.vectors = {vertices: vectors(data.vertices), normals: vectors(data.normals)};
+        }
+        const gradient = new $3Dmol.Gradient.RWB(level === null ? mesh.min : -level, level === null ? mesh.max : level);
+        state.viewer.addCustom({
+            vertexArr: data.vectors.vertices,
+            normalArr: data.vectors.normals,
+            faceArr: data.faces,
+            colorArr: data.values.map(function (value) { return $3Dmol.CC.color(gradient.valueToHex(value)); }),
+            opacity: mesh.opacity,
+        });
+    }
+
+    function surfaceStyle(state, surface) {
+        // With a level control, the colour range is -value..value.
+        const level = levelValue();
+        return {
+            opacity: surface.opacity,
+            voldata: volume(surface.volume),
+            volscheme: {gradient: "rwb", min: level === null ? surface.min : -level, max: level === null ? surface.max : level},
+        };
+    }
+
+    function drawSurface(state, spec) {
+        state.viewer.removeAllSurfaces();
+        state.surfid = null;
+        const surface = spec.surface;
+        if (surface) {
+            const added = state.viewer.addSurface($3Dmol.SurfaceType[surface.type], surfaceStyle(state, surface));
+            state.surfid = added && added.surfid !== undefined ? added.surfid : added;
+        }
+    }
+
+    function recolorSurface(state, spec) {
+        // Only the colours depend on the range, so the mesh is kept.
+        if (spec.surface && state.surfid !== null && state.surfid !== undefined) {
+            state.viewer.setSurfaceMaterialStyle(state.surfid, surfaceStyle(state, spec.surface));
+        }
+    }
+
+    function blobIds(spec) {
+        const ids = [spec.model];
+        (spec.isosurfaces || []).forEach(function (iso) { ids.push(iso.volume); });
+        if (spec.surface && spec.surface.volume) {
+            ids.push(spec.surface.volume);
+        }
+        if (spec.mesh) {
+            ids.push(spec.mesh.blob);
+        }
+        return ids;
+    }
+
+    function changed(prev, spec, part) {
+        return !prev || JSON.stringify(prev[part]) !== JSON.stringify(spec[part]);
+    }
+
+    function ensureViewers(scenes) {
+        const heights = scenes.map(function (s) { return s.height; });
+        const current = states.map(function (s) { return s.height; });
+        if (JSON.stringify(heights) === JSON.stringify(current)) {
+            return;
+        }
+        states.forEach(function (s) { s.viewer.clear(); });
+        root.innerHTML = "";
+        slider = null;
+        states = scenes.map(function (spec) {
+            const element = document.createElement("div");
+            element.className = "mol-container";
+            element.style.height = spec.height + "px";
+            root.appendChild(element);
+            const viewer = $3Dmol.createViewer(element, {});
+            viewer.setBackgroundColor(0xffffff, 0.0);
+            return {viewer: viewer, element: element, height: spec.height, spec: null};
+        });
+        states.forEach(function (a) {
+            states.forEach(function (b) {
+                if (a !== b) {
+                    a.viewer.linkViewer(b.viewer);
+                }
+            });
+        });
+    }
+
+    function applyScene(state, spec, levelChanged) {
+        const v = state.viewer;
+        const prev = state.spec;
+        const reload = changed(prev, spec, "model") || changed(prev, spec, "format")
+            || changed(prev, spec, "model_options") || changed(prev, spec, "vibrate");
+        if (reload) {
+            v.stopAnimate();
+            v.clear();
+            if (spec.format === "modes") {
+                addModeModel(state, spec);
+            } else {
+                if (state.control) {
+                    state.control.remove();
+                    state.control = null;
+                }
+                v.addModel(blobs.get(spec.model), spec.format,
+                    spec.model_options || {keepH: true, assignBonds: true});
+            }
+            if (spec.vibrate) {
+                v.vibrate(spec.vibrate.frames, spec.vibrate.amplitude, spec.vibrate.both_ways);
+                v.animate({loop: spec.vibrate.loop});
+            }
+        }
+        const propertiesChanged = changed(prev, spec, "properties");
+        if (propertiesChanged) {
+            propertyControl(state, spec.properties);
+        }
+        if (reload || propertiesChanged || ["style", "labels", "label_style", "colors", "hover_labels"].some(function (part) {
+            return changed(prev, spec, part);
+        })) {
+            drawProperty(state, spec);
+        }
+        if (reload || levelChanged || changed(prev, spec, "isosurfaces") || changed(prev, spec, "mesh")) {
+            drawShapes(state, spec);
+        }
+        if (reload || changed(prev, spec, "surface")) {
+            drawSurface(state, spec);
+        } else if (levelChanged) {
+            recolorSurface(state, spec);
+        }
+        if (reload && state.zoomed !== spec.model) {
+            // Keep the camera when only the mode or styling changed.
+            state.zoomed = spec.model;
+            v.zoomTo();
+        }
+        v.render();
+        state.spec = spec;
+    }
+
+    function render(args) {
+        const incoming = args.blobs || {};
+        Object.keys(incoming).forEach(function (id) { putBlob(id, incoming[id]); });
+        const urls = args.urls || {};
+        const fetching = Object.keys(urls).filter(function (id) { return !blobs.has(id); });
+        if (fetching.length > 0) {
+            Promise.all(fetching.map(function (id) { return fetchBlob(id, urls[id]); }))
+                .then(function () { render(Object.assign({}, args, {blobs: {}})); })
+                .catch(function (error) { console.error("viewer3d:", error); });
+            return;
+        }
+        const scenes = args.scenes || [];
+        const missing = [];
+        scenes.forEach(function (spec) {
+            blobIds(spec).forEach(function (id) {
+                if (!blobs.has(id)) {
+                    missing.push(id);
+                }
+            });
+        });
+        if (missing.length > 0) {
+            // Ask Python to resend: report what is still held, with a fresh nonce
+            // so the reply is only acted upon once.
+            send("streamlit:setComponentValue", {
+                value: {nonce: Date.now().toString(36) + Math.random().toString(36).slice(2), resident: Array.from(blobs.keys())},
+                dataType: "json",
+            });
+            return;
+        }
+        ensureViewers(scenes);
+        const levelChanged = levelControl(args.level);
+        scenes.forEach(function (spec, i) { applyScene(states[i], spec, levelChanged); });
+        setFrameHeight(scenes.reduce(function (total, spec) { return total + spec.height; }, 0));
+    }
+
+    window.addEventListener("message", function (event) {
+        if (event.data && event.data.type === "streamlit:render") {
+            const args = event.data.args;
+            library = library || loadLibrary(args.library);
+            library.then(function () { render(args); });
+        }
+    });
+    send("streamlit:componentReady", {apiVersion: 1});
+})();